@@ -19,6 +19,9 @@ def _run_conversion(
     dry_run: bool,
     strict: bool,
     direction: Direction,
+    force: bool = False,
+    jobs: int | None = None,
+    no_cache: bool = False,
 ) -> None:
     """Shared implementation for both conversion directions.
 
@@ -31,6 +34,9 @@ def _run_conversion(
         dry_run: Show what would change without writing.
         strict: Treat warnings as errors.
         direction: Conversion direction.
+        force: Convert files even if their output is up to date.
+        jobs: Number of conversion processes (None for one per CPU).
+        no_cache: Regenerate config files even if they are up to date.
     """
     collector = WarningCollector(strict=strict)
 
@@ -42,6 +48,9 @@ def _run_conversion(
         config_only=config_only,
         no_config=no_config,
         dry_run=dry_run,
+        force=force,
+        no_cache=no_cache,
+        num_workers=jobs,
     )
 
     # Collect warnings and errors from results
@@ -62,6 +71,10 @@ def _run_conversion(
 
     click.echo(f"{label} {converted_count} file(s).")
 
+    skipped_count = sum(1 for r in results if r.skipped)
+    if skipped_count:
+        click.echo(f"Skipped {skipped_count} up-to-date file(s).")
+
     if collector.warnings or collector.errors:
         click.echo(collector.report())
 
@@ -69,97 +82,96 @@ def _run_conversion(
         sys.exit(1)
 
 
-@click.command()
-@click.argument("path", type=click.Path(exists=True))
-@click.option("--output", "-o", type=click.Path(), help="Output directory")
-@click.option("--in-place", is_flag=True, help="Modify files in-place")
-@click.option("--config-only", is_flag=True, help="Only convert config files")
-@click.option("--no-config", is_flag=True, help="Skip config file conversion")
-@click.option("--dry-run", is_flag=True, help="Show what would change without writing")
-@click.option("--strict", is_flag=True, help="Treat warnings as errors")
-def myst2quarto(path, output, in_place, config_only, no_config, dry_run, strict):
-    """Convert MyST markdown files to Quarto format."""
-    _run_conversion(
-        path=path,
-        output=output,
-        in_place=in_place,
-        config_only=config_only,
-        no_config=no_config,
-        dry_run=dry_run,
-        strict=strict,
-        direction=Direction.MYST_TO_QUARTO,
-    )
+# Argument and options shared by every conversion command
+_CONVERSION_PARAMS = (
+    click.argument("path", type=click.Path(exists=True)),
+    click.option("--output", "-o", type=click.Path(), help="Output directory"),
+    click.option("--in-place", is_flag=True, help="Modify files in-place"),
+    click.option("--config-only", is_flag=True, help="Only convert config files"),
+    click.option("--no-config", is_flag=True, help="Skip config file conversion"),
+    click.option(
+        "--dry-run", is_flag=True, help="Show what would change without writing"
+    ),
+    click.option("--strict", is_flag=True, help="Treat warnings as errors"),
+    click.option("--force", is_flag=True, help="Convert files even if up to date"),
+    click.option(
+        "--jobs",
+        "-j",
+        type=click.IntRange(min=1),
+        help="Number of conversion processes (default: one per CPU)",
+    ),
+    click.option("--no-cache", is_flag=True, help="Always regenerate config files"),
+)
+
+# ctx.meta key under which the group's --no-cache reaches its subcommands
+_NO_CACHE_META = "mystquarto.no_cache"
+
+
+def _make_conversion_command(name: str, direction: Direction, help_text: str):
+    """Build a conversion command callback with the shared params applied.
+
+    Args:
+        name: Function name for the callback (shown in tracebacks).
+        direction: Conversion direction the command runs.
+        help_text: Docstring, used by Click as the command help.
 
+    Returns:
+        The decorated callback, ready for click.command() or group.command().
+    """
 
-@click.command()
-@click.argument("path", type=click.Path(exists=True))
-@click.option("--output", "-o", type=click.Path(), help="Output directory")
-@click.option("--in-place", is_flag=True, help="Modify files in-place")
-@click.option("--config-only", is_flag=True, help="Only convert config files")
-@click.option("--no-config", is_flag=True, help="Skip config file conversion")
-@click.option("--dry-run", is_flag=True, help="Show what would change without writing")
-@click.option("--strict", is_flag=True, help="Treat warnings as errors")
-def quarto2myst(path, output, in_place, config_only, no_config, dry_run, strict):
-    """Convert Quarto markdown files to MyST format."""
-    _run_conversion(
-        path=path,
-        output=output,
-        in_place=in_place,
-        config_only=config_only,
-        no_config=no_config,
-        dry_run=dry_run,
-        strict=strict,
-        direction=Direction.QUARTO_TO_MYST,
+    def callback(no_cache, **kwargs):
+        no_cache = no_cache or click.get_current_context().meta.get(
+            _NO_CACHE_META, False
+        )
+        _run_conversion(direction=direction, no_cache=no_cache, **kwargs)
+
+    callback.__name__ = name
+    callback.__doc__ = help_text
+    for decorator in reversed(_CONVERSION_PARAMS):
+        callback = decorator(callback)
+    return callback
+
+
+myst2quarto = click.command("myst2quarto")(
+    _make_conversion_command(
+        "myst2quarto",
+        Direction.MYST_TO_QUARTO,
+        "Convert MyST markdown files to Quarto format.",
+    )
+)
+
+quarto2myst = click.command("quarto2myst")(
+    _make_conversion_command(
+        "quarto2myst",
+        Direction.QUARTO_TO_MYST,
+        "Convert Quarto markdown files to MyST format.",
     )
+)
 
 
 @click.group(invoke_without_command=True)
+@click.option("--no-cache", is_flag=True, help="Always regenerate config files")
 @click.pass_context
-def main(ctx):
+def main(ctx, no_cache):
     """Bidirectional MyST <-> Quarto converter."""
+    if no_cache:
+        ctx.meta[_NO_CACHE_META] = True
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help())
 
 
-@main.command("to-quarto")
-@click.argument("path", type=click.Path(exists=True))
-@click.option("--output", "-o", type=click.Path(), help="Output directory")
-@click.option("--in-place", is_flag=True, help="Modify files in-place")
-@click.option("--config-only", is_flag=True, help="Only convert config files")
-@click.option("--no-config", is_flag=True, help="Skip config file conversion")
-@click.option("--dry-run", is_flag=True, help="Show what would change without writing")
-@click.option("--strict", is_flag=True, help="Treat warnings as errors")
-def to_quarto(path, output, in_place, config_only, no_config, dry_run, strict):
-    """Convert MyST markdown files to Quarto format."""
-    _run_conversion(
-        path=path,
-        output=output,
-        in_place=in_place,
-        config_only=config_only,
-        no_config=no_config,
-        dry_run=dry_run,
-        strict=strict,
-        direction=Direction.MYST_TO_QUARTO,
+to_quarto = main.command("to-quarto")(
+    _make_conversion_command(
+        "to_quarto",
+        Direction.MYST_TO_QUARTO,
+        "Convert MyST markdown files to Quarto format.",
     )
+)
 
-
-@main.command("to-myst")
-@click.argument("path", type=click.Path(exists=True))
-@click.option("--output", "-o", type=click.Path(), help="Output directory")
-@click.option("--in-place", is_flag=True, help="Modify files in-place")
-@click.option("--config-only", is_flag=True, help="Only convert config files")
-@click.option("--no-config", is_flag=True, help="Skip config file conversion")
-@click.option("--dry-run", is_flag=True, help="Show what would change without writing")
-@click.option("--strict", is_flag=True, help="Treat warnings as errors")
-def to_myst(path, output, in_place, config_only, no_config, dry_run, strict):
-    """Convert Quarto markdown files to MyST format."""
-    _run_conversion(
-        path=path,
-        output=output,
-        in_place=in_place,
-        config_only=config_only,
-        no_config=no_config,
-        dry_run=dry_run,
-        strict=strict,
-        direction=Direction.QUARTO_TO_MYST,
+to_myst = main.command("to-myst")(
+    _make_conversion_command(
+        "to_myst",
+        Direction.QUARTO_TO_MYST,
+        "Convert Quarto markdown files to MyST format.",
     )
+)
@@ -2,9 +2,96 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
+import json
 import os
+from collections.abc import Callable
+from pathlib import Path
 
-import yaml
+from mystquarto import __version__
+from mystquarto.constants import CONFIG_CACHE_SUFFIX, NO_CACHE_ENV
+from mystquarto.yamlio import dump_yaml, load_yaml
+
+
+def _content_hash(data: bytes) -> str:
+    """Digest of a source config's bytes, recorded in the sidecar."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> tuple[dict, str]:
+    """Parse a YAML config file, memoized on (path, mtime, size).
+
+    The stat fields are only part of the cache key, so an edited file is
+    reparsed. The cached dict is shared between callers and must not be
+    mutated; the converters below copy every value they take from it.
+
+    The raw bytes go straight to the parser, which detects the encoding and
+    decodes them itself.
+
+    Returns:
+        Tuple of (parsed config, content hash of the parsed bytes).
+    """
+    data = Path(path).read_bytes()
+    return load_yaml(data) or {}, _content_hash(data)
+
+
+def _source_stamp(src_path: str) -> dict:
+    """Identify the current state of a source config for the sidecar cache.
+
+    The stamp also keys the parse cache, so each conversion stats the source
+    exactly once.
+    """
+    st = os.stat(src_path)
+    return {
+        "src": os.path.abspath(src_path),
+        "src_mtime_ns": st.st_mtime_ns,
+        "src_size": st.st_size,
+        "version": __version__,
+    }
+
+
+def _load_stamped_yaml(src_path: str, stamp: dict) -> tuple[dict, str]:
+    """Load a YAML config file through the parse cache, keyed by its stamp."""
+    return _load_yaml_cached(src_path, stamp["src_mtime_ns"], stamp["src_size"])
+
+
+def _is_up_to_date(src_path: str, stamp: dict, output_path: str) -> bool:
+    """Check whether output_path was generated from the stamped source.
+
+    A source whose mtime changed but whose size did not (e.g. touched by a
+    checkout) is compared by content hash before being declared stale; on
+    a match the sidecar is refreshed, so the next check is a stat again.
+    """
+    if os.environ.get(NO_CACHE_ENV):
+        return False
+    if not os.path.exists(output_path):
+        return False
+    try:
+        with open(output_path + CONFIG_CACHE_SUFFIX) as f:
+            recorded = json.load(f)
+        if not isinstance(recorded, dict):
+            return False
+        src_hash = recorded.pop("src_hash", None)
+        if recorded == stamp:
+            return True
+        recorded["src_mtime_ns"] = stamp["src_mtime_ns"]
+        if src_hash is None or recorded != stamp:
+            return False
+        if _content_hash(Path(src_path).read_bytes()) != src_hash:
+            return False
+        _write_sidecar(stamp, src_hash, output_path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _write_sidecar(stamp: dict, src_hash: str, output_path: str) -> None:
+    """Record the source state that output_path was generated from."""
+    with open(output_path + CONFIG_CACHE_SUFFIX, "w") as f:
+        json.dump({**stamp, "src_hash": src_hash}, f)
 
 
 def _is_book_project(myst_config: dict) -> bool:
@@ -38,9 +125,7 @@ def _toc_to_chapters(toc: list[dict]) -> list[str]:
         else:
             continue
         # Strip existing .md extension before adding .qmd
-        if name.endswith(".md"):
-            name = name[:-3]
-        chapters.append(f"{name}.qmd")
+        chapters.append(f"{name.removesuffix('.md')}.qmd")
     return chapters
 
 
@@ -50,36 +135,15 @@ def _chapters_to_toc(chapters: list[str]) -> list[dict]:
     Each chapter is a filename (possibly with .qmd extension).
     Returns list of dicts with 'file' key (no extension).
     """
-    toc = []
-    for chapter in chapters:
-        filename = chapter
-        # Strip .qmd or .md extension
-        for ext in (".qmd", ".md"):
-            if filename.endswith(ext):
-                filename = filename[: -len(ext)]
-                break
-        toc.append({"file": filename})
-    return toc
-
-
-def _convert_authors_myst_to_quarto(authors: list[dict]) -> list[dict]:
-    """Convert MyST author entries to Quarto format.
-
-    Both use similar structures with name and affiliations.
-    """
-    result = []
-    for author in authors:
-        entry = {}
-        if "name" in author:
-            entry["name"] = author["name"]
-        if "affiliations" in author:
-            entry["affiliations"] = author["affiliations"]
-        # Pass through any other fields
-        for key, value in author.items():
-            if key not in ("name", "affiliations"):
-                entry[key] = value
-        result.append(entry)
-    return result
+    # Strip one .qmd or .md extension
+    return [
+        {
+            "file": chapter.removesuffix(".qmd")
+            if chapter.endswith(".qmd")
+            else chapter.removesuffix(".md")
+        }
+        for chapter in chapters
+    ]
 
 
 def _convert_exports_to_format(exports: list[dict]) -> dict:
@@ -109,10 +173,80 @@ def _convert_format_to_exports(format_block: dict) -> list[dict]:
     return exports
 
 
+# Sentinel for "key not present", so each field costs a single dict lookup
+_MISSING = object()
+
+# Field tables: (source key, target key, value converter or None). Fields are
+# copied in table order, which is the key order of the written YAML. Lists
+# and dicts are deep-copied before conversion (author lists, which use the
+# same structure in both formats, have no converter), so results never
+# alias the (possibly cached) source config.
+
+# MyST project -> Quarto book block (book projects)
+_MYST_BOOK_FIELDS = (
+    ("title", "title", None),
+    ("authors", "author", None),
+    ("toc", "chapters", _toc_to_chapters),
+)
+
+# MyST project -> Quarto top level (article/manuscript projects)
+_MYST_ARTICLE_FIELDS = (
+    ("title", "title", None),
+    ("authors", "author", None),
+)
+
+# MyST project -> Quarto top level (both project types)
+_MYST_SHARED_FIELDS = (
+    ("bibliography", "bibliography", None),
+    ("exports", "format", _convert_exports_to_format),
+    ("github", "repo-url", None),
+    ("license", "license", None),
+    ("keywords", "keywords", None),
+    ("date", "date", None),
+    ("subject", "description", None),
+)
+
+# Quarto book block -> MyST project (book projects)
+_QUARTO_BOOK_FIELDS = (
+    ("title", "title", None),
+    ("author", "authors", None),
+    ("chapters", "toc", _chapters_to_toc),
+)
+
+# Quarto top level -> MyST project (article/manuscript projects)
+_QUARTO_ARTICLE_FIELDS = (
+    ("title", "title", None),
+    ("author", "authors", None),
+)
+
+# Quarto top level -> MyST project (both project types)
+_QUARTO_SHARED_FIELDS = (
+    ("bibliography", "bibliography", None),
+    ("format", "exports", _convert_format_to_exports),
+    ("repo-url", "github", None),
+    ("license", "license", None),
+    ("keywords", "keywords", None),
+    ("date", "date", None),
+    ("description", "subject", None),
+)
+
+
+def _copy_fields(source: dict, target: dict, fields: tuple) -> None:
+    """Copy the fields present in source to target, converting values."""
+    for source_key, target_key, convert in fields:
+        value = source.get(source_key, _MISSING)
+        if value is _MISSING:
+            continue
+        if isinstance(value, (list, dict)):
+            value = copy.deepcopy(value)
+        target[target_key] = convert(value) if convert else value
+
+
 def myst_to_quarto_config(myst_config: dict) -> dict:
     """Convert a parsed myst.yml dict to a _quarto.yml dict.
 
-    Handles both book-type and article/manuscript projects.
+    Handles both book-type and article/manuscript projects. The result
+    shares no lists or dicts with the input.
     """
     if not myst_config:
         return {}
@@ -122,49 +256,19 @@ def myst_to_quarto_config(myst_config: dict) -> dict:
         return {}
 
     result = {}
-    is_book = _is_book_project(myst_config)
 
-    if is_book:
+    if _is_book_project(myst_config):
         # Book-type project
         result["project"] = {"type": "book"}
         book = {}
-
-        if "title" in project:
-            book["title"] = project["title"]
-        if "authors" in project:
-            book["author"] = _convert_authors_myst_to_quarto(project["authors"])
-        if "toc" in project:
-            book["chapters"] = _toc_to_chapters(project["toc"])
-
+        _copy_fields(project, book, _MYST_BOOK_FIELDS)
         result["book"] = book
     else:
         # Article/manuscript project
-        if "title" in project:
-            result["title"] = project["title"]
-        if "authors" in project:
-            result["author"] = _convert_authors_myst_to_quarto(project["authors"])
+        _copy_fields(project, result, _MYST_ARTICLE_FIELDS)
 
     # Fields that apply to both types
-    if "bibliography" in project:
-        result["bibliography"] = project["bibliography"]
-
-    if "exports" in project:
-        result["format"] = _convert_exports_to_format(project["exports"])
-
-    if "github" in project:
-        result["repo-url"] = project["github"]
-
-    if "license" in project:
-        result["license"] = project["license"]
-
-    if "keywords" in project:
-        result["keywords"] = project["keywords"]
-
-    if "date" in project:
-        result["date"] = project["date"]
-
-    if "subject" in project:
-        result["description"] = project["subject"]
+    _copy_fields(project, result, _MYST_SHARED_FIELDS)
 
     return result
 
@@ -172,7 +276,8 @@ def myst_to_quarto_config(myst_config: dict) -> dict:
 def quarto_to_myst_config(quarto_config: dict) -> dict:
     """Convert a parsed _quarto.yml dict to a myst.yml dict.
 
-    Handles both book-type and article/manuscript projects.
+    Handles both book-type and article/manuscript projects. The result
+    shares no lists or dicts with the input.
     """
     if not quarto_config:
         return {}
@@ -185,51 +290,59 @@ def quarto_to_myst_config(quarto_config: dict) -> dict:
     )
 
     if is_book:
-        book = quarto_config.get("book", {})
-        if "title" in book:
-            project["title"] = book["title"]
-        if "author" in book:
-            project["authors"] = book["author"]
-        if "chapters" in book:
-            project["toc"] = _chapters_to_toc(book["chapters"])
+        _copy_fields(quarto_config.get("book", {}), project, _QUARTO_BOOK_FIELDS)
         result["site"] = {"template": "book-theme"}
     else:
-        if "title" in quarto_config:
-            project["title"] = quarto_config["title"]
-        if "author" in quarto_config:
-            project["authors"] = quarto_config["author"]
+        _copy_fields(quarto_config, project, _QUARTO_ARTICLE_FIELDS)
 
     # Fields that apply to both types
-    if "bibliography" in quarto_config:
-        project["bibliography"] = quarto_config["bibliography"]
+    _copy_fields(quarto_config, project, _QUARTO_SHARED_FIELDS)
 
-    if "format" in quarto_config:
-        project["exports"] = _convert_format_to_exports(quarto_config["format"])
+    if project:
+        result["project"] = project
 
-    if "repo-url" in quarto_config:
-        project["github"] = quarto_config["repo-url"]
+    return result
 
-    if "license" in quarto_config:
-        project["license"] = quarto_config["license"]
 
-    if "keywords" in quarto_config:
-        project["keywords"] = quarto_config["keywords"]
+def write_converted_config(
+    src_path: str,
+    output_path: str,
+    convert: Callable[[dict], dict],
+    force: bool = False,
+) -> bool:
+    """Convert the config at src_path with convert and write it to output_path.
 
-    if "date" in quarto_config:
-        project["date"] = quarto_config["date"]
+    Skipped when a sidecar shows output_path was already generated from
+    this exact source, by stat or by content (unless ``force`` or
+    MYSTQUARTO_NO_CACHE is set).
 
-    if "description" in quarto_config:
-        project["subject"] = quarto_config["description"]
+    Args:
+        src_path: Path to the input config file.
+        output_path: Path of the config file to write.
+        convert: Function mapping the parsed source config to the output one.
+        force: If True, write output_path even if it is up to date.
 
-    if project:
-        result["project"] = project
+    Returns:
+        True if output_path was up to date and left alone, False if written.
+    """
+    stamp = _source_stamp(src_path)
+    if not force and _is_up_to_date(src_path, stamp, output_path):
+        return True
 
-    return result
+    config, src_hash = _load_stamped_yaml(src_path, stamp)
+
+    Path(output_path).write_text(dump_yaml(convert(config)), encoding="utf-8")
+    _write_sidecar(stamp, src_hash, output_path)
+
+    return False
 
 
 def convert_myst_config(myst_yml_path: str, output_dir: str) -> str:
     """Read myst.yml, convert to _quarto.yml, write to output_dir.
 
+    Skipped when _quarto.yml is already up to date (see
+    write_converted_config).
+
     Args:
         myst_yml_path: Path to the input myst.yml file.
         output_dir: Directory to write _quarto.yml to.
@@ -237,21 +350,17 @@ def convert_myst_config(myst_yml_path: str, output_dir: str) -> str:
     Returns:
         Path to the output _quarto.yml file.
     """
-    with open(myst_yml_path) as f:
-        myst_config = yaml.safe_load(f) or {}
-
-    quarto_config = myst_to_quarto_config(myst_config)
-
     output_path = os.path.join(output_dir, "_quarto.yml")
-    with open(output_path, "w") as f:
-        yaml.dump(quarto_config, f, default_flow_style=False, sort_keys=False)
-
+    write_converted_config(myst_yml_path, output_path, myst_to_quarto_config)
     return output_path
 
 
 def convert_quarto_config(quarto_yml_path: str, output_dir: str) -> str:
     """Read _quarto.yml, convert to myst.yml, write to output_dir.
 
+    Skipped when myst.yml is already up to date (see
+    write_converted_config).
+
     Args:
         quarto_yml_path: Path to the input _quarto.yml file.
         output_dir: Directory to write myst.yml to.
@@ -259,13 +368,6 @@ def convert_quarto_config(quarto_yml_path: str, output_dir: str) -> str:
     Returns:
         Path to the output myst.yml file.
     """
-    with open(quarto_yml_path) as f:
-        quarto_config = yaml.safe_load(f) or {}
-
-    myst_config = quarto_to_myst_config(quarto_config)
-
     output_path = os.path.join(output_dir, "myst.yml")
-    with open(output_path, "w") as f:
-        yaml.dump(myst_config, f, default_flow_style=False, sort_keys=False)
-
+    write_converted_config(quarto_yml_path, output_path, quarto_to_myst_config)
     return output_path
@@ -0,0 +1,11 @@
+"""Constants shared by the converters and the CLI.
+
+Kept free of imports so that modules needing them do not load YAML.
+"""
+
+# Suffix of the JSON sidecar recording which source a converted config was
+# generated from (e.g. _quarto.yml.cache.json)
+CONFIG_CACHE_SUFFIX = ".cache.json"
+
+# Environment variable that, when set, forces configs to be regenerated
+NO_CACHE_ENV = "MYSTQUARTO_NO_CACHE"
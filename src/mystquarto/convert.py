@@ -4,19 +4,19 @@ from __future__ import annotations
 
 import os
 import shutil
+import stat
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 
-import yaml
+from mystquarto.constants import CONFIG_CACHE_SUFFIX
 
-from mystquarto.config import convert_myst_config, convert_quarto_config
-from mystquarto.frontmatter import (
-    extract_frontmatter,
-    myst_to_quarto_frontmatter,
-    quarto_to_myst_frontmatter,
-)
-from mystquarto.transforms.myst_to_quarto import convert_myst_to_quarto
-from mystquarto.transforms.quarto_to_myst import convert_quarto_to_myst
+# The markdown transforms and multiprocessing are imported inside the
+# functions that use them, so config-only runs never load them. The config
+# and frontmatter modules (and with them PyYAML) are deferred the same way,
+# so `--help` and directory scans start without YAML.
 
 
 class Direction(Enum):
@@ -26,7 +26,7 @@ class Direction(Enum):
     QUARTO_TO_MYST = "quarto_to_myst"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionResult:
     """Result of converting a single file."""
 
@@ -38,11 +38,195 @@ class ConversionResult:
     dry_run: bool = False
 
 
+@dataclass
+class DiscoveredFiles:
+    """Files found in a project directory, grouped by how they are handled.
+
+    Each list is sorted.
+    """
+
+    md_files: list[str] = field(default_factory=list)
+    config_files: list[str] = field(default_factory=list)
+    asset_files: list[str] = field(default_factory=list)
+
+
 # File extensions for each direction
-_MYST_EXTENSIONS = {".md"}
-_QUARTO_EXTENSIONS = {".qmd"}
+_MYST_EXTENSIONS = frozenset({".md"})
+_QUARTO_EXTENSIONS = frozenset({".qmd"})
+_ALL_MD_EXTENSIONS = _MYST_EXTENSIONS | _QUARTO_EXTENSIONS
 _MYST_CONFIG = "myst.yml"
 _QUARTO_CONFIG = "_quarto.yml"
+_CONFIG_NAMES = frozenset({_MYST_CONFIG, _QUARTO_CONFIG})
+
+# Config cache sidecar name -> name of the config it belongs to
+_SIDECAR_CONFIGS = {name + CONFIG_CACHE_SUFFIX: name for name in _CONFIG_NAMES}
+
+# (direction, input extension) -> output extension
+_EXT_REMAP = {
+    (Direction.MYST_TO_QUARTO, ".md"): ".qmd",
+    (Direction.QUARTO_TO_MYST, ".qmd"): ".md",
+}
+
+# Directories never searched for files or assets
+_SKIP_DIRS = frozenset(
+    {
+        "_build",
+        ".git",
+        ".hg",
+        "__pycache__",
+        "node_modules",
+        ".venv",
+        "venv",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        "_site",
+        ".quarto",
+    }
+)
+
+# Below this many markdown files, starting a process pool costs more than it
+# saves, so conversion stays serial.
+_PARALLEL_THRESHOLD = 8
+
+# Directory listing and asset copying are latency-bound (especially on
+# network filesystems), so both run on a thread pool of this size.
+_IO_WORKERS = 16
+
+# Assets at least this large are copied with os.copy_file_range, which lets
+# copy-on-write filesystems (btrfs, XFS) share extents instead of copying data
+_COPY_RANGE_MIN_SIZE = 1 << 20
+
+
+def _scan_directory(path: str) -> tuple[list[str], list[tuple[str, str]]]:
+    """List a single directory with os.scandir.
+
+    Skipped directories are filtered out here, before they are queued, and
+    symlinked directories are not descended into (matching os.walk).
+
+    Returns:
+        Tuple of (subdirectory paths, (filename, path) pairs for files).
+    """
+    subdirs: list[str] = []
+    files: list[tuple[str, str]] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if entry.name not in _SKIP_DIRS and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                else:
+                    files.append((entry.name, entry.path))
+    except OSError:
+        pass
+    return subdirs, files
+
+
+def _file_ext(filename: str) -> str:
+    """Return the extension of a bare filename, as os.path.splitext would.
+
+    Leading dots do not start an extension (".gitignore" has none).
+    """
+    dot = filename.rfind(".")
+    if dot > 0 and (filename[0] != "." or filename[:dot].lstrip(".")):
+        return filename[dot:]
+    return ""
+
+
+def _has_file(entries: list[tuple[str, str]], filename: str) -> bool:
+    """Check whether a directory listing from _scan_directory has filename."""
+    return any(name == filename for name, _ in entries)
+
+
+def iter_files(directory: str, direction: Direction) -> Iterator[tuple[str, str]]:
+    """Yield (kind, path) for each file as the directory traversal finds it.
+
+    ``kind`` is "md" or "config" for markdown and config files of the source
+    format for ``direction``, or "asset" for any other file. Markdown and
+    config files of the other format, and config cache sidecars next to the
+    config they describe, are not yielded at all. Paths come in traversal
+    order, not sorted, so callers can start work before the whole tree has
+    been listed.
+
+    Args:
+        directory: Path to the directory to search.
+        direction: Conversion direction.
+
+    Yields:
+        Tuples of (kind, absolute file path).
+    """
+    if direction == Direction.MYST_TO_QUARTO:
+        extensions = _MYST_EXTENSIONS
+        config_name = _MYST_CONFIG
+    else:
+        extensions = _QUARTO_EXTENSIONS
+        config_name = _QUARTO_CONFIG
+
+    # Breadth-first: list every directory of one level concurrently, then
+    # move on to the subdirectories they contain. Each level's thread pool
+    # is shut down before anything is yielded, so callers may fork (e.g. to
+    # start a process pool) without copying live scan threads' locks.
+    pending = [directory]
+    while pending:
+        if len(pending) == 1:
+            listings = [_scan_directory(pending[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(_IO_WORKERS, len(pending))
+            ) as executor:
+                listings = list(executor.map(_scan_directory, pending))
+
+        next_pending: list[str] = []
+        for subdirs, entries in listings:
+            next_pending.extend(subdirs)
+            for filename, filepath in entries:
+                ext = _file_ext(filename)
+
+                if ext in extensions:
+                    yield "md", filepath
+                elif filename == config_name:
+                    yield "config", filepath
+                elif ext in _ALL_MD_EXTENSIONS or filename in _CONFIG_NAMES:
+                    continue
+                elif filename in _SIDECAR_CONFIGS and _has_file(
+                    entries, _SIDECAR_CONFIGS[filename]
+                ):
+                    # A sidecar this tool wrote next to a generated config
+                    continue
+                else:
+                    yield "asset", filepath
+        pending = next_pending
+
+
+def discover_all(directory: str, direction: Direction) -> DiscoveredFiles:
+    """Find convertible files and assets in a single directory traversal.
+
+    See iter_files for how files are classified.
+
+    Args:
+        directory: Path to the directory to search.
+        direction: Conversion direction.
+
+    Returns:
+        DiscoveredFiles with absolute paths.
+    """
+    found = DiscoveredFiles()
+    buckets = {
+        "md": found.md_files,
+        "config": found.config_files,
+        "asset": found.asset_files,
+    }
+    for kind, path in iter_files(directory, direction):
+        buckets[kind].append(path)
+
+    found.md_files.sort()
+    found.config_files.sort()
+    found.asset_files.sort()
+    return found
 
 
 def discover_files(directory: str, direction: Direction) -> list[str]:
@@ -58,45 +242,95 @@ def discover_files(directory: str, direction: Direction) -> list[str]:
     Returns:
         List of absolute file paths.
     """
+    found = discover_all(directory, direction)
+    return sorted(found.md_files + found.config_files)
+
+
+def _is_output_current(input_path: str, output_path: str) -> bool:
+    """Check if output_path is a non-empty file at least as new as input_path."""
+    if os.path.abspath(input_path) == os.path.abspath(output_path):
+        return False
+    try:
+        input_stat = os.stat(input_path)
+        output_stat = os.stat(output_path)
+    except OSError:
+        return False
+    return output_stat.st_size > 0 and output_stat.st_mtime_ns >= input_stat.st_mtime_ns
+
+
+def _read_source(path: str) -> str:
+    """Read a UTF-8 source file, normalizing newlines like text-mode reads.
+
+    Decoding the whole file in one call is cheaper than the incremental
+    decoder behind Path.read_text.
+    """
+    text = Path(path).read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _open_output(output_path: str):
+    """Open output_path for writing, creating its directory only if missing.
+
+    Output directories almost always exist already (most files share one),
+    so the mkdir is only attempted after an open fails.
+    """
+    try:
+        return open(output_path, "w", encoding="utf-8")
+    except FileNotFoundError:
+        output_dir = os.path.dirname(output_path)
+        if not output_dir:
+            raise
+        os.makedirs(output_dir, exist_ok=True)
+        return open(output_path, "w", encoding="utf-8")
+
+
+def _convert_text_parts(text: str, direction: Direction) -> tuple[str, ...]:
+    """Convert a document, returning the output as consecutive pieces."""
+    from mystquarto.frontmatter import (
+        extract_frontmatter,
+        myst_to_quarto_frontmatter,
+        quarto_to_myst_frontmatter,
+    )
+    from mystquarto.transforms.myst_to_quarto import convert_myst_to_quarto
+    from mystquarto.transforms.quarto_to_myst import convert_quarto_to_myst
+    from mystquarto.yamlio import dump_yaml
+
+    # Extract and transform frontmatter
+    fm, body = extract_frontmatter(text)
+    if fm:
+        if direction == Direction.MYST_TO_QUARTO:
+            new_fm = myst_to_quarto_frontmatter(fm)
+        else:
+            new_fm = quarto_to_myst_frontmatter(fm)
+    else:
+        new_fm = None
+
+    # Transform body text
     if direction == Direction.MYST_TO_QUARTO:
-        extensions = _MYST_EXTENSIONS
-        config_name = _MYST_CONFIG
+        transformed_body = convert_myst_to_quarto(body)
     else:
-        extensions = _QUARTO_EXTENSIONS
-        config_name = _QUARTO_CONFIG
+        transformed_body = convert_quarto_to_myst(body)
 
-    # Directories to skip
-    skip_dirs = {
-        "_build",
-        ".git",
-        ".hg",
-        "__pycache__",
-        "node_modules",
-        ".venv",
-        "venv",
-        ".tox",
-        ".mypy_cache",
-        ".pytest_cache",
-        "_site",
-        ".quarto",
-    }
+    if new_fm:
+        return ("---\n", dump_yaml(new_fm), "---\n", transformed_body)
+    return (transformed_body,)
 
-    files: list[str] = []
 
-    for root, dirs, filenames in os.walk(directory):
-        # Prune skipped directories
-        dirs[:] = [d for d in dirs if d not in skip_dirs]
+def convert_text(text: str, direction: Direction) -> str:
+    """Convert a whole document (frontmatter and body) held in memory.
 
-        for filename in filenames:
-            filepath = os.path.join(root, filename)
-            _, ext = os.path.splitext(filename)
+    This is what convert_file does between reading and writing.
 
-            if ext in extensions:
-                files.append(filepath)
-            elif filename == config_name:
-                files.append(filepath)
+    Args:
+        text: Full source document text.
+        direction: Conversion direction.
 
-    return sorted(files)
+    Returns:
+        The converted document text.
+    """
+    return "".join(_convert_text_parts(text, direction))
 
 
 def convert_file(
@@ -104,14 +338,19 @@ def convert_file(
     output_path: str,
     direction: Direction,
     dry_run: bool = False,
+    force: bool = False,
 ) -> ConversionResult:
     """Convert a single markdown file.
 
+    Files whose output is already up to date (non-empty and no older than
+    the input) are skipped without being read, unless ``force`` is set.
+
     Args:
         input_path: Path to the input file.
         output_path: Path for the output file.
         direction: Conversion direction.
         dry_run: If True, do not write output.
+        force: If True, convert even if the output is up to date.
 
     Returns:
         ConversionResult with details about the conversion.
@@ -122,53 +361,99 @@ def convert_file(
         dry_run=dry_run,
     )
 
+    # Dry runs always report the file so users see the full would-convert list
+    if not force and not dry_run and _is_output_current(input_path, output_path):
+        result.skipped = True
+        return result
+
     # Read input
     try:
-        with open(input_path) as f:
-            text = f.read()
-    except (OSError, IOError) as e:
+        text = _read_source(input_path)
+    except (OSError, UnicodeDecodeError) as e:
         result.errors.append(f"Could not read {input_path}: {e}")
         return result
 
-    # Extract and transform frontmatter
-    fm, body = extract_frontmatter(text)
-    if fm:
-        if direction == Direction.MYST_TO_QUARTO:
-            new_fm = myst_to_quarto_frontmatter(fm)
-        else:
-            new_fm = quarto_to_myst_frontmatter(fm)
-    else:
-        new_fm = None
-
-    # Transform body text
-    if direction == Direction.MYST_TO_QUARTO:
-        transformed_body = convert_myst_to_quarto(body)
-    else:
-        transformed_body = convert_quarto_to_myst(body)
-
-    # Reconstruct full text
-    if new_fm:
-        fm_yaml = yaml.dump(new_fm, default_flow_style=False, sort_keys=False)
-        output_text = "---\n" + fm_yaml + "---\n" + transformed_body
-    else:
-        output_text = transformed_body
+    # Output pieces, written in sequence rather than concatenated into one
+    # more copy of the whole document
+    output_parts = _convert_text_parts(text, direction)
 
     # Write output (unless dry_run)
     if not dry_run:
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-
         try:
-            with open(output_path, "w") as f:
-                f.write(output_text)
-        except (OSError, IOError) as e:
+            with _open_output(output_path) as f:
+                f.writelines(output_parts)
+        except OSError as e:
             result.errors.append(f"Could not write {output_path}: {e}")
 
     return result
 
 
+def _convert_one(task: tuple[str, str, Direction, bool, bool]) -> ConversionResult:
+    """Convert one (input_path, output_path, direction, dry_run, force) task.
+
+    Module-level so it can be pickled for a process pool.
+    """
+    return convert_file(*task)
+
+
+def _convert_markdown_files(
+    tasks: Iterable[tuple[str, str, Direction, bool, bool]],
+    num_workers: int | None = None,
+) -> list[ConversionResult]:
+    """Convert markdown files as tasks arrive, in parallel when there are many.
+
+    The first _PARALLEL_THRESHOLD tasks are buffered. If more arrive, a
+    process pool of ``num_workers`` processes (default: one per CPU) is
+    started and every task is submitted as soon as it is seen, so
+    conversion overlaps with discovery. With one worker, everything runs
+    serially in this process. Results are returned in the same order as
+    ``tasks``.
+    """
+    workers = num_workers or os.cpu_count() or 1
+    tasks = iter(tasks)
+    buffered = []
+    for task in tasks:
+        buffered.append(task)
+        if len(buffered) >= _PARALLEL_THRESHOLD and workers > 1:
+            break
+    else:
+        return [_convert_one(task) for task in buffered]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_convert_one, task) for task in buffered]
+        futures.extend(executor.submit(_convert_one, task) for task in tasks)
+        return [future.result() for future in futures]
+
+
+def _remap_ext(path: str, direction: Direction) -> str:
+    """Swap a .md/.qmd extension for the other format's, per direction.
+
+    Paths with any other extension (or none) are returned unchanged.
+    """
+    dot = path.rfind(".")
+    if dot <= 0 or path[dot - 1] == os.sep:
+        return path
+    new_ext = _EXT_REMAP.get((direction, path[dot:]))
+    if new_ext is None:
+        return path
+    return path[:dot] + new_ext
+
+
+def _relative_to(path: str, directory: str) -> str:
+    """Return path relative to directory.
+
+    Discovered paths are built by joining names onto directory, so the
+    relative part is usually a plain suffix; os.path.relpath (which
+    normalizes both arguments) is only needed for other paths.
+    """
+    prefix = os.path.join(directory, "")
+    if path.startswith(prefix):
+        return path[len(prefix) :]
+    return os.path.relpath(path, directory)
+
+
 def _get_output_path(
     input_path: str,
     input_dir: str,
@@ -187,22 +472,9 @@ def _get_output_path(
         The output file path.
     """
     # Get relative path from input dir
-    rel_path = os.path.relpath(input_path, input_dir)
-    base, ext = os.path.splitext(rel_path)
+    rel_path = _relative_to(input_path, input_dir)
 
-    # Change extension
-    if direction == Direction.MYST_TO_QUARTO:
-        if ext == ".md":
-            new_ext = ".qmd"
-        else:
-            new_ext = ext
-    else:
-        if ext == ".qmd":
-            new_ext = ".md"
-        else:
-            new_ext = ext
-
-    return os.path.join(output_dir, base + new_ext)
+    return os.path.join(output_dir, _remap_ext(rel_path, direction))
 
 
 def _default_output_dir(input_dir: str, direction: Direction) -> str:
@@ -227,6 +499,9 @@ def convert_directory(
     config_only: bool = False,
     no_config: bool = False,
     dry_run: bool = False,
+    force: bool = False,
+    num_workers: int | None = None,
+    no_cache: bool = False,
 ) -> list[ConversionResult]:
     """Convert all files in a directory.
 
@@ -238,6 +513,14 @@ def convert_directory(
         config_only: If True, only convert config files.
         no_config: If True, skip config file conversion.
         dry_run: If True, do not write any files.
+        force: If True, convert files (markdown and config) even if their
+            output is up to date. In-place conversion always converts every
+            markdown file.
+        num_workers: Number of processes converting markdown files (None
+            for one per CPU, 1 to convert serially). Small projects are
+            always converted serially.
+        no_cache: If True, convert config files even if their output is
+            up to date.
 
     Returns:
         List of ConversionResult for each processed file.
@@ -246,7 +529,9 @@ def convert_directory(
 
     # Handle single file path
     if os.path.isfile(input_dir):
-        return _convert_single_file_path(input_dir, output_dir, direction, dry_run)
+        return _convert_single_file_path(
+            input_dir, output_dir, direction, dry_run, force
+        )
 
     # Determine output directory
     if in_place:
@@ -260,41 +545,62 @@ def convert_directory(
     if not dry_run:
         os.makedirs(effective_output_dir, exist_ok=True)
 
-    # Discover files
-    all_files = discover_files(input_dir, direction)
-
-    # Separate config files from markdown files
-    config_name = (
-        _MYST_CONFIG if direction == Direction.MYST_TO_QUARTO else _QUARTO_CONFIG
-    )
-    config_files = [f for f in all_files if os.path.basename(f) == config_name]
-    md_files = [f for f in all_files if os.path.basename(f) != config_name]
-
-    # Convert config files
-    if not no_config:
-        for config_path in config_files:
-            config_result = _convert_config_file(
-                config_path, input_dir, effective_output_dir, direction, dry_run
-            )
-            results.append(config_result)
-
-    # Convert markdown files (unless config_only)
-    if not config_only:
-        for md_path in md_files:
-            out_path = _get_output_path(
-                md_path, input_dir, effective_output_dir, direction
-            )
-            md_result = convert_file(md_path, out_path, direction, dry_run)
-            results.append(md_result)
-
-            # If in-place, remove original file (it has been renamed)
-            if in_place and not dry_run and not md_result.errors:
-                if md_path != out_path and os.path.exists(md_path):
-                    os.remove(md_path)
+    config_results: list[ConversionResult] = []
+    md_tasks: list[tuple[str, str, Direction, bool, bool]] = []
+    asset_files: list[str] = []
+
+    def markdown_tasks():
+        """Walk the tree once, handling configs and assets along the way.
+
+        Configs are converted as soon as they are found; markdown tasks are
+        yielded so conversion can start before discovery finishes.
+        """
+        for kind, path in iter_files(input_dir, direction):
+            if kind == "config":
+                if not no_config:
+                    config_results.append(
+                        _convert_config_file(
+                            path,
+                            input_dir,
+                            effective_output_dir,
+                            direction,
+                            dry_run,
+                            force or no_cache,
+                        )
+                    )
+            elif kind == "md":
+                if not config_only:
+                    task = (
+                        path,
+                        _get_output_path(
+                            path, input_dir, effective_output_dir, direction
+                        ),
+                        direction,
+                        dry_run,
+                        force or in_place,
+                    )
+                    md_tasks.append(task)
+                    yield task
+            else:
+                asset_files.append(path)
+
+    md_results = _convert_markdown_files(markdown_tasks(), num_workers)
+
+    # Report configs first, then markdown files, each sorted by input path
+    results.extend(sorted(config_results, key=lambda r: r.input_path))
+    converted = sorted(zip(md_tasks, md_results), key=lambda pair: pair[0][0])
+    results.extend(md_result for _, md_result in converted)
+
+    # Remove originals only once every worker has finished
+    for (md_path, out_path, *_), md_result in converted:
+        # If in-place, remove original file (it has been renamed)
+        if in_place and not dry_run and not md_result.errors:
+            if md_path != out_path and os.path.exists(md_path):
+                os.remove(md_path)
 
     # Copy non-markdown assets to output (bib, images, etc.)
     if not in_place and not dry_run and not config_only:
-        _copy_assets(input_dir, effective_output_dir, direction)
+        _copy_assets(asset_files, input_dir, effective_output_dir)
 
     return results
 
@@ -304,11 +610,11 @@ def _convert_single_file_path(
     output_dir: str | None,
     direction: Direction,
     dry_run: bool,
+    force: bool = False,
 ) -> list[ConversionResult]:
     """Handle conversion when input path is a single file."""
     parent_dir = os.path.dirname(file_path)
     filename = os.path.basename(file_path)
-    base, ext = os.path.splitext(filename)
 
     # Determine output directory
     if output_dir is None:
@@ -319,53 +625,73 @@ def _convert_single_file_path(
         os.makedirs(output_dir, exist_ok=True)
 
     # Determine output filename with new extension
-    if direction == Direction.MYST_TO_QUARTO and ext == ".md":
-        out_filename = base + ".qmd"
-    elif direction == Direction.QUARTO_TO_MYST and ext == ".qmd":
-        out_filename = base + ".md"
-    else:
-        out_filename = filename
-
-    out_path = os.path.join(output_dir, out_filename)
+    out_path = os.path.join(output_dir, _remap_ext(filename, direction))
 
-    result = convert_file(file_path, out_path, direction, dry_run)
+    result = convert_file(file_path, out_path, direction, dry_run, force)
     return [result]
 
 
-def _copy_assets(input_dir: str, output_dir: str, direction: Direction) -> None:
-    """Copy non-markdown assets (bib, images, static dirs) to output."""
-    skip_dirs = {
-        "_build",
-        ".git",
-        ".hg",
-        "__pycache__",
-        "node_modules",
-        ".venv",
-        "venv",
-        ".tox",
-        ".mypy_cache",
-        ".pytest_cache",
-        "_site",
-        ".quarto",
-    }
-    md_exts = _MYST_EXTENSIONS | _QUARTO_EXTENSIONS
-    config_names = {_MYST_CONFIG, _QUARTO_CONFIG}
+def _copy_file_range(src: str, dst: str) -> bool:
+    """Copy src to dst with os.copy_file_range.
+
+    Returns False when the platform, kernel or filesystem does not support
+    it, or stops copying early (some filesystems report 0 bytes copied
+    instead of raising), in which case dst may hold a partial copy and must
+    be rewritten.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            return False
+    return remaining <= 0
 
-    for root, dirs, filenames in os.walk(input_dir):
-        dirs[:] = [d for d in dirs if d not in skip_dirs]
 
-        for filename in filenames:
-            _, ext = os.path.splitext(filename)
-            if ext in md_exts or filename in config_names:
-                continue
+def _copy_asset(src: str, dst: str) -> None:
+    """Copy one asset unless dst already exists.
 
-            src = os.path.join(root, filename)
-            rel = os.path.relpath(src, input_dir)
-            dst = os.path.join(output_dir, rel)
+    Permission bits are copied only for executable sources (e.g. helper
+    scripts); other copies keep the default mode for new files.
+    """
+    if os.path.exists(dst):
+        return
+    st = os.stat(src)
+    if not (st.st_size >= _COPY_RANGE_MIN_SIZE and _copy_file_range(src, dst)):
+        shutil.copyfile(src, dst)
+    if st.st_mode & 0o111:
+        os.chmod(dst, stat.S_IMODE(st.st_mode))
+
+
+def _copy_assets(asset_files: list[str], input_dir: str, output_dir: str) -> None:
+    """Copy non-markdown assets (bib, images, static dirs) to output.
+
+    Only file contents, plus the mode of executable files, are copied
+    (shutil.copyfile, or copy_file_range for large files, both zero-copy in
+    the kernel where available); copies get fresh mtimes. Both the existence
+    check and the copy run on the I/O thread pool.
+    """
+    copies: list[tuple[str, str]] = []
+    created_dirs: set[str] = set()
+    for src in asset_files:
+        rel = _relative_to(src, input_dir)
+        dst = os.path.join(output_dir, rel)
+
+        dst_dir = os.path.dirname(dst)
+        if dst_dir not in created_dirs:
+            os.makedirs(dst_dir, exist_ok=True)
+            created_dirs.add(dst_dir)
+        copies.append((src, dst))
 
-            os.makedirs(os.path.dirname(dst), exist_ok=True)
-            if not os.path.exists(dst):
-                shutil.copy2(src, dst)
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+        # Consume the iterator so that copy errors are raised here
+        list(executor.map(lambda pair: _copy_asset(*pair), copies))
 
 
 def _convert_config_file(
@@ -374,6 +700,7 @@ def _convert_config_file(
     output_dir: str,
     direction: Direction,
     dry_run: bool,
+    force: bool = False,
 ) -> ConversionResult:
     """Convert a config file (myst.yml or _quarto.yml).
 
@@ -383,6 +710,7 @@ def _convert_config_file(
         output_dir: Base output directory.
         direction: Conversion direction.
         dry_run: If True, do not write.
+        force: If True, convert even if the output is up to date.
 
     Returns:
         ConversionResult for the config conversion.
@@ -400,14 +728,26 @@ def _convert_config_file(
             result.output_path = os.path.join(output_dir, _MYST_CONFIG)
         return result
 
-    try:
-        os.makedirs(output_dir, exist_ok=True)
+    from mystquarto.config import (
+        myst_to_quarto_config,
+        quarto_to_myst_config,
+        write_converted_config,
+    )
 
-        if direction == Direction.MYST_TO_QUARTO:
-            out_path = convert_myst_config(config_path, output_dir)
-        else:
-            out_path = convert_quarto_config(config_path, output_dir)
+    if direction == Direction.MYST_TO_QUARTO:
+        out_path = os.path.join(output_dir, _QUARTO_CONFIG)
+        convert = myst_to_quarto_config
+    else:
+        out_path = os.path.join(output_dir, _MYST_CONFIG)
+        convert = quarto_to_myst_config
 
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        # Configs already generated from this source count as skipped, like
+        # up-to-date markdown files
+        result.skipped = write_converted_config(
+            config_path, out_path, convert, force=force
+        )
         result.output_path = out_path
     except Exception as e:
         result.errors.append(f"Config conversion failed: {e}")
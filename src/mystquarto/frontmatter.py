@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 
 import yaml
 
+from mystquarto.yamlio import dump_yaml, load_yaml
+
 
 # Fields that are MyST-only and should be removed when converting to Quarto
 _MYST_ONLY_FIELDS = {"math", "abbreviations"}
@@ -13,6 +17,21 @@ _MYST_ONLY_FIELDS = {"math", "abbreviations"}
 _PASSTHROUGH_FIELDS = {"title", "author", "date", "tags"}
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_frontmatter(yaml_text: str) -> dict | None:
+    """Parse a frontmatter block, memoized on its exact text.
+
+    Chapters of one project often share a header (kernelspec, jupytext),
+    so repeated blocks are parsed once. Returns None for invalid YAML or a
+    non-mapping. The cached dict is shared and must not be mutated.
+    """
+    try:
+        fm = load_yaml(yaml_text)
+    except yaml.YAMLError:
+        return None
+    return fm if isinstance(fm, dict) else None
+
+
 def extract_frontmatter(text: str) -> tuple[dict | None, str]:
     """Split text into (frontmatter_dict, body_text).
 
@@ -26,36 +45,35 @@ def extract_frontmatter(text: str) -> tuple[dict | None, str]:
     if not text.startswith("---"):
         return None, text
 
-    # Find the closing ---
-    # Split after the first line (which is ---)
-    lines = text.split("\n")
-    if len(lines) < 2:
+    # The opening --- line ends at the first newline
+    start = text.find("\n") + 1
+    if not start:
         return None, text
 
-    # Find closing --- (must be on its own line)
-    end_idx = None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            end_idx = i
+    # Find the closing --- (must be on its own line), jumping between
+    # candidate "---" substrings rather than splitting the whole document
+    idx = text.find("---", start)
+    while idx != -1:
+        line_start = text.rfind("\n", 0, idx) + 1
+        line_end = text.find("\n", idx)
+        if line_end == -1:
+            line_end = len(text)
+        if text[line_start:line_end].strip() == "---":
             break
-
-    if end_idx is None:
+        idx = text.find("---", line_end)
+    else:
         return None, text
 
     # Parse the YAML between the markers
-    yaml_text = "\n".join(lines[1:end_idx])
-    try:
-        fm = yaml.safe_load(yaml_text)
-    except yaml.YAMLError:
-        return None, text
-
-    if not isinstance(fm, dict):
+    fm = _parse_frontmatter(text[start : line_start - 1])
+    if fm is None:
         return None, text
 
     # Body is everything after the closing ---
-    body = "\n".join(lines[end_idx + 1 :])
+    body = text[line_end + 1 :]
 
-    return fm, body
+    # Callers get their own copy, free to mutate
+    return copy.deepcopy(fm), body
 
 
 def replace_frontmatter(text: str, new_fm: dict) -> str:
@@ -66,16 +84,113 @@ def replace_frontmatter(text: str, new_fm: dict) -> str:
         new_fm: The new frontmatter dict to insert.
 
     Returns:
-        Text with updated frontmatter.
+        Text with updated frontmatter. The text is returned as-is when its
+        frontmatter already equals new_fm, and without frontmatter when
+        new_fm is empty, so YAML is only dumped when something changed.
     """
-    _, body = extract_frontmatter(text)
+    existing_fm, body = extract_frontmatter(text)
+
+    if new_fm == existing_fm:
+        return text
+    if not new_fm:
+        return body
+
+    # --- marker, yaml, --- marker, body, joined in one allocation rather
+    # than through a chain of intermediate concatenations
+    return "".join(("---\n", dump_yaml(new_fm), "---\n", body))
+
+
+# Per-key handlers: each takes (result, value) and writes the converted
+# field(s) into result. Keys without a handler pass through unchanged.
+
+
+def _drop_field(result: dict, value) -> None:
+    """Leave the field out of the converted frontmatter."""
+
+
+def _kernelspec_to_jupyter(result: dict, value) -> None:
+    kernel_name = value.get("name", "python3") if isinstance(value, dict) else value
+    result["jupyter"] = kernel_name
+
+
+def _label_to_id(result: dict, value) -> None:
+    result["id"] = value
+
+
+def _exports_to_format(result: dict, value) -> None:
+    format_block = {}
+    for export in value:
+        fmt = export.get("format")
+        if not fmt:
+            continue
+        options = {k: v for k, v in export.items() if k != "format"}
+        format_block[fmt] = options if options else {}
+    result["format"] = format_block
+
+
+def _numbering_to_crossref(result: dict, value) -> None:
+    eq_config = value.get("equation", {}) if isinstance(value, dict) else {}
+    template = eq_config.get("template")
+    if template:
+        result["crossref"] = {"eq-prefix": template}
+
+
+def _jupyter_to_kernelspec(result: dict, value) -> None:
+    kernel_name = value if isinstance(value, str) else value.get("name", "python3")
+    result["kernelspec"] = {
+        "name": kernel_name,
+        "display_name": kernel_name.replace("python3", "Python 3").replace("ir", "R"),
+    }
+
+
+def _id_to_label(result: dict, value) -> None:
+    result["label"] = value
+
+
+def _format_to_exports(result: dict, value) -> None:
+    exports = []
+    if isinstance(value, dict):
+        for fmt, options in value.items():
+            export = {"format": fmt}
+            if isinstance(options, dict):
+                export.update(options)
+            exports.append(export)
+    result["exports"] = exports
+
+
+def _crossref_to_numbering(result: dict, value) -> None:
+    eq_prefix = value.get("eq-prefix") if isinstance(value, dict) else None
+    if eq_prefix:
+        result["numbering"] = {"equation": {"template": eq_prefix}}
 
-    # Dump the new frontmatter
-    fm_yaml = yaml.dump(new_fm, default_flow_style=False, sort_keys=False)
 
-    # Build result: --- marker, yaml, --- marker, body
-    result = "---\n" + fm_yaml + "---\n" + body
+_MYST_TO_QUARTO_HANDLERS = {
+    "kernelspec": _kernelspec_to_jupyter,  # kernelspec -> jupyter
+    "jupytext": _drop_field,
+    **dict.fromkeys(_MYST_ONLY_FIELDS, _drop_field),
+    "label": _label_to_id,  # label -> id
+    "exports": _exports_to_format,  # exports -> format
+    "numbering": _numbering_to_crossref,  # equation template -> eq-prefix
+}
 
+_QUARTO_TO_MYST_HANDLERS = {
+    "jupyter": _jupyter_to_kernelspec,  # jupyter -> kernelspec
+    "id": _id_to_label,  # id -> label
+    "format": _format_to_exports,  # format -> exports
+    "crossref": _crossref_to_numbering,  # eq-prefix -> equation template
+}
+
+
+def _apply_handlers(fm: dict, handlers: dict) -> dict:
+    """Convert frontmatter with one handler lookup per key."""
+    result = {}
+    for key, value in fm.items():
+        handler = handlers.get(key)
+        if handler is None:
+            # Everything else passes through
+            result[key] = value
+        else:
+            handler(result, value)
     return result
 
 
@@ -94,54 +209,7 @@ def myst_to_quarto_frontmatter(fm: dict) -> dict:
     if not fm:
         return {}
 
-    result = {}
-
-    for key, value in fm.items():
-        # kernelspec -> jupyter
-        if key == "kernelspec":
-            kernel_name = (
-                value.get("name", "python3") if isinstance(value, dict) else value
-            )
-            result["jupyter"] = kernel_name
-            continue
-
-        # jupytext -> remove
-        if key == "jupytext":
-            continue
-
-        # MyST-only fields -> remove
-        if key in _MYST_ONLY_FIELDS:
-            continue
-
-        # label -> id
-        if key == "label":
-            result["id"] = value
-            continue
-
-        # exports -> format
-        if key == "exports":
-            format_block = {}
-            for export in value:
-                fmt = export.get("format")
-                if not fmt:
-                    continue
-                options = {k: v for k, v in export.items() if k != "format"}
-                format_block[fmt] = options if options else {}
-            result["format"] = format_block
-            continue
-
-        # numbering.equation.template -> crossref.eq-prefix
-        if key == "numbering":
-            eq_config = value.get("equation", {}) if isinstance(value, dict) else {}
-            template = eq_config.get("template")
-            if template:
-                result["crossref"] = {"eq-prefix": template}
-            continue
-
-        # Everything else passes through
-        result[key] = value
-
-    return result
+    return _apply_handlers(fm, _MYST_TO_QUARTO_HANDLERS)
 
 
 def quarto_to_myst_frontmatter(fm: dict) -> dict:
@@ -152,47 +220,4 @@ def quarto_to_myst_frontmatter(fm: dict) -> dict:
     if not fm:
         return {}
 
-    result = {}
-
-    for key, value in fm.items():
-        # jupyter -> kernelspec
-        if key == "jupyter":
-            kernel_name = (
-                value if isinstance(value, str) else value.get("name", "python3")
-            )
-            result["kernelspec"] = {
-                "name": kernel_name,
-                "display_name": kernel_name.replace("python3", "Python 3").replace(
-                    "ir", "R"
-                ),
-            }
-            continue
-
-        # id -> label
-        if key == "id":
-            result["label"] = value
-            continue
-
-        # format -> exports
-        if key == "format":
-            exports = []
-            if isinstance(value, dict):
-                for fmt, options in value.items():
-                    export = {"format": fmt}
-                    if isinstance(options, dict):
-                        export.update(options)
-                    exports.append(export)
-            result["exports"] = exports
-            continue
-
-        # crossref.eq-prefix -> numbering.equation.template
-        if key == "crossref":
-            eq_prefix = value.get("eq-prefix") if isinstance(value, dict) else None
-            if eq_prefix:
-                result["numbering"] = {"equation": {"template": eq_prefix}}
-            continue
-
-        # Everything else passes through
-        result[key] = value
-
-    return result
+    return _apply_handlers(fm, _QUARTO_TO_MYST_HANDLERS)
@@ -13,9 +13,24 @@ BACKTICK_OPEN_RE = re.compile(r"^(\s*)(`{3,})\{(\w[\w-]*)\}\s*(.*)$")
 COLON_OPEN_RE = re.compile(r"^(\s*)(:{3,})\{(\w[\w-]*)\}\s*(.*)$")
 # Option line: :key: value (must appear right after opening fence)
 OPTION_RE = re.compile(r"^:(\w[\w-]*):\s*(.*)$")
+# Regular code fence open: ``` or ~~~, optionally followed by a language
+_REGULAR_FENCE_RE = re.compile(r"^(\s*)(`{3,}|~{3,})(\w*)\s*$")
 
 
-@dataclass
+def _match_close_fence(line: str, fence_char: str) -> tuple[int, int] | None:
+    """Match a line consisting only of 3+ fence_char and surrounding whitespace.
+
+    Returns:
+        (indent, fence_count) if the line is such a fence, otherwise None.
+    """
+    stripped = line.lstrip()
+    fence = stripped.rstrip()
+    if len(fence) < 3 or fence.lstrip(fence_char):
+        return None
+    return len(line) - len(stripped), len(fence)
+
+
+@dataclass(slots=True)
 class DirectiveFrame:
     """Represents a parsed MyST directive block."""
 
@@ -61,7 +76,11 @@ class Scanner:
             The transformed text with directives processed.
         """
         lines = text.split("\n")
+        # Output lines are collected in a list and joined once at the end.
+        # Unchanged lines are shared with the input rather than copied, which
+        # makes this cheaper than writing each line to an io.StringIO.
         output_lines: list[str] = []
+        emit = output_lines.append
         # Track whether we are in the options section of a directive
         in_options = False
         # Track regular (non-directive) code fences to avoid transforming
@@ -71,20 +90,24 @@ class Scanner:
         regular_fence_count = 0
         regular_fence_indent = 0
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        for line in lines:
             stripped = line.lstrip()
             indent = len(line) - len(stripped)
 
             # ----------------------------------------------------------
             # Check if this line opens a directive fence
             # ----------------------------------------------------------
-            backtick_m = BACKTICK_OPEN_RE.match(line)
-            colon_m = COLON_OPEN_RE.match(line)
-            open_match = backtick_m or colon_m
+            # Both fence patterns need a backtick or colon as the first
+            # non-space character, so most lines skip the regex entirely
+            open_match = None
+            if not in_regular_code_fence:
+                first = stripped[:1]
+                if first == "`":
+                    open_match = BACKTICK_OPEN_RE.match(line)
+                elif first == ":":
+                    open_match = COLON_OPEN_RE.match(line)
 
-            if open_match and not in_regular_code_fence:
+            if open_match:
                 leading_ws = open_match.group(1)
                 fence_str = open_match.group(2)
                 directive_name = open_match.group(3)
@@ -102,7 +125,6 @@ class Scanner:
                 )
                 self.stack.append(frame)
                 in_options = True
-                i += 1
                 continue
 
             # ----------------------------------------------------------
@@ -111,46 +133,48 @@ class Scanner:
             if self.stack:
                 current = self.stack[-1]
 
-                # Check for closing fence
-                if self._is_close_fence(stripped, indent, current):
+                # Check for closing fence (only body lines that start with
+                # the fence character need the full check)
+                if stripped[:1] == current.fence_char and self._is_close_fence(
+                    stripped, indent, current
+                ):
                     # Pop the frame and transform
                     frame = self.stack.pop()
                     transformed = self.transform_fn(frame)
 
                     if self.stack:
                         # Nested: add transformed lines to parent body
-                        for tl in transformed:
-                            self.stack[-1].body_lines.append(tl)
+                        self.stack[-1].body_lines.extend(transformed)
                     else:
                         output_lines.extend(transformed)
 
                     in_options = False
-                    i += 1
                     continue
 
                 # Check for option lines (only right after opening)
                 if in_options:
-                    # Strip the directive's indentation from the line
-                    content = self._strip_indent(line, current.indent)
-                    opt_match = OPTION_RE.match(content.strip())
+                    # Option lines start with ":" once indentation is removed;
+                    # anything else ends the options section without a regex
+                    opt_match = (
+                        OPTION_RE.match(stripped.rstrip())
+                        if stripped[:1] == ":"
+                        else None
+                    )
                     if opt_match:
                         key = opt_match.group(1)
                         value = opt_match.group(2).strip()
                         current.options[key] = value
-                        i += 1
                         continue
                     else:
                         # End of options section
                         in_options = False
                         # Skip blank lines between options and body
-                        if content.strip() == "":
-                            i += 1
+                        if not stripped:
                             continue
 
                 # Body line for the current directive
                 content = self._strip_indent(line, current.indent)
                 current.body_lines.append(content)
-                i += 1
                 continue
 
             # ----------------------------------------------------------
@@ -158,52 +182,34 @@ class Scanner:
             # ----------------------------------------------------------
             # Check for regular code fence (``` or ~~~ without {directive})
             if not in_regular_code_fence:
-                regular_fence_m = re.match(r"^(\s*)(`{3,}|~{3,})(\w*)\s*$", line)
+                regular_fence_m = _REGULAR_FENCE_RE.match(line)
                 if regular_fence_m:
                     regular_fence_indent = len(regular_fence_m.group(1))
                     regular_fence_char = regular_fence_m.group(2)[0]
                     regular_fence_count = len(regular_fence_m.group(2))
-                    # Only if it looks like a regular fence (has language or is plain)
                     in_regular_code_fence = True
-                    output_lines.append(line)
-                    i += 1
-                    continue
-                # Also check opening fences with language like ```python
-                regular_fence_m2 = re.match(r"^(\s*)(`{3,}|~{3,})(\w+)\s*$", line)
-                if regular_fence_m2:
-                    regular_fence_indent = len(regular_fence_m2.group(1))
-                    regular_fence_char = regular_fence_m2.group(2)[0]
-                    regular_fence_count = len(regular_fence_m2.group(2))
-                    in_regular_code_fence = True
-                    output_lines.append(line)
-                    i += 1
+                    emit(line)
                     continue
             else:
                 # Inside a regular code fence: check for close
-                close_m = re.match(
-                    r"^(\s*)(" + re.escape(regular_fence_char) + r"{3,})\s*$",
-                    line,
-                )
-                if close_m:
-                    close_count = len(close_m.group(2))
-                    close_indent = len(close_m.group(1))
+                close_fence = _match_close_fence(line, regular_fence_char)
+                if close_fence:
+                    close_indent, close_count = close_fence
                     if (
                         close_count >= regular_fence_count
                         and close_indent <= regular_fence_indent
                     ):
                         in_regular_code_fence = False
-                output_lines.append(line)
-                i += 1
+                emit(line)
                 continue
 
             # ----------------------------------------------------------
             # Regular line: apply inline transforms
             # ----------------------------------------------------------
             if self.inline_fn:
-                output_lines.append(self.inline_fn(line))
+                emit(self.inline_fn(line))
             else:
-                output_lines.append(line)
-            i += 1
+                emit(line)
 
         # Handle unclosed directives (shouldn't happen in valid input,
         # but handle gracefully)
@@ -224,7 +230,7 @@ class Scanner:
         if stripped[0] != frame.fence_char:
             return False
         # Must be all the same char
-        if not all(c == frame.fence_char for c in stripped):
+        if stripped.lstrip(frame.fence_char):
             return False
         # Must have at least as many chars as the opening fence
         if len(stripped) < frame.fence_count:
@@ -238,15 +244,6 @@ class Scanner:
         """Remove up to `indent` spaces from the beginning of a line."""
         if indent == 0:
             return line
-        # Remove up to indent characters of whitespace
-        removed = 0
-        for ch in line:
-            if removed >= indent:
-                break
-            if ch == " ":
-                removed += 1
-            elif ch == "\t":
-                removed += 1  # treat tab as 1 for simplicity
-            else:
-                break
-        return line[removed:]
+        # Remove up to indent characters of whitespace (a tab counts as 1)
+        leading = len(line) - len(line.lstrip(" \t"))
+        return line[min(leading, indent) :]
@@ -10,29 +10,16 @@ from mystquarto.scanner import DirectiveFrame, Scanner
 # Inline role transform patterns
 # ---------------------------------------------------------------------------
 
-# {eval}`expr`
-_EVAL_RE = re.compile(r"\{eval\}`([^`]+)`")
+# {role}`content` for every supported role, matched in a single pass:
+#   {eval}`expr`, {cite:t}`key`, {cite:p}`key`, {cite}`key1,key2,...`,
+#   {numref}`Figure %s <fig-id>`, {ref}`label`, {eq}`label`, {doc}`path`
+# Group 1 is the role name, group 2 the content.
+_INLINE_ROLE_RE = re.compile(
+    r"\{(eval|cite:t|cite:p|cite|numref|ref|eq|doc)\}`([^`]+)`"
+)
 
-# {cite:t}`key`  (must come before generic {cite})
-_CITE_T_RE = re.compile(r"\{cite:t\}`([^`]+)`")
-
-# {cite:p}`key`  (must come before generic {cite})
-_CITE_P_RE = re.compile(r"\{cite:p\}`([^`]+)`")
-
-# {cite}`key` or {cite}`key1,key2,...`
-_CITE_RE = re.compile(r"\{cite\}`([^`]+)`")
-
-# {numref}`Figure %s <fig-id>` or {numref}`fig-id`
-_NUMREF_RE = re.compile(r"\{numref\}`([^`]+)`")
-
-# {ref}`label`
-_REF_RE = re.compile(r"\{ref\}`([^`]+)`")
-
-# {eq}`label`
-_EQ_RE = re.compile(r"\{eq\}`([^`]+)`")
-
-# {doc}`path`
-_DOC_RE = re.compile(r"\{doc\}`([^`]+)`")
+# Target of a numref format string: `Figure %s <fig-id>` -> fig-id
+_NUMREF_TARGET_RE = re.compile(r".*<(.+)>$")
 
 # Regular markdown links to .md files: [text](path.md) -> [text](path.qmd)
 _MD_LINK_RE = re.compile(r"(\[[^\]]*\]\([^)]*?)\.md(\))")
@@ -54,53 +41,65 @@ _TAG_MAP = {
 # ---------------------------------------------------------------------------
 
 
-def _replace_eval(m: re.Match) -> str:
-    return f"`{{python}} {m.group(1)}`"
+def _replace_eval(content: str) -> str:
+    return f"`{{python}} {content}`"
 
 
-def _replace_cite_t(m: re.Match) -> str:
-    return f"@{m.group(1).strip()}"
+def _replace_cite_t(content: str) -> str:
+    return f"@{content.strip()}"
 
 
-def _replace_cite_p(m: re.Match) -> str:
-    keys = [k.strip() for k in m.group(1).split(",")]
-    if len(keys) == 1:
-        return f"[@{keys[0]}]"
-    return "[" + "; ".join(f"@{k}" for k in keys) + "]"
+def _replace_cite(content: str) -> str:
+    # Most citations name a single key; skip the split for those
+    if "," not in content:
+        return f"[@{content.strip()}]"
+    return "[" + "; ".join(f"@{k.strip()}" for k in content.split(",")) + "]"
 
 
-def _replace_cite(m: re.Match) -> str:
-    keys = [k.strip() for k in m.group(1).split(",")]
-    if len(keys) == 1:
-        return f"[@{keys[0]}]"
-    return "[" + "; ".join(f"@{k}" for k in keys) + "]"
-
-
-def _replace_numref(m: re.Match) -> str:
-    content = m.group(1).strip()
+def _replace_numref(content: str) -> str:
+    content = content.strip()
     # Handle format string: {numref}`Figure %s <fig-id>`
-    angle_m = re.match(r".*<(.+)>$", content)
+    angle_m = _NUMREF_TARGET_RE.match(content)
     if angle_m:
         return f"@{angle_m.group(1).strip()}"
     return f"@{content}"
 
 
-def _replace_ref(m: re.Match) -> str:
-    return f"@{m.group(1).strip()}"
+def _replace_ref(content: str) -> str:
+    return f"@{content.strip()}"
 
 
-def _replace_eq(m: re.Match) -> str:
-    label = m.group(1).strip()
+def _replace_eq(content: str) -> str:
+    label = content.strip()
     if not label.startswith("eq-"):
         label = f"eq-{label}"
     return f"@{label}"
 
 
-def _replace_doc(m: re.Match) -> str:
-    path = m.group(1).strip()
+def _replace_doc(content: str) -> str:
+    path = content.strip()
     return f"[{path}]({path}.qmd)"
 
 
+# Role name -> replacement for the content of {role}`content`
+# ({cite:p} and bare {cite} both render as parenthetical citations)
+_ROLE_HANDLERS = {
+    "eval": _replace_eval,
+    "cite:t": _replace_cite_t,
+    "cite:p": _replace_cite,
+    "cite": _replace_cite,
+    "numref": _replace_numref,
+    "ref": _replace_ref,
+    "eq": _replace_eq,
+    "doc": _replace_doc,
+}
+
+
+def _replace_role(m: re.Match) -> str:
+    role, content = m.groups()
+    return _ROLE_HANDLERS[role](content)
+
+
 def transform_inline(line: str) -> str:
     """Transform MyST inline roles to Quarto syntax on a single line.
 
@@ -112,21 +111,18 @@ def transform_inline(line: str) -> str:
     if not line:
         return line
 
-    # Apply all inline role transforms directly on the full line.
-    # The regexes are specific enough ({role}`...`) that they will not
-    # match inside regular code spans (which lack the {role} prefix).
-    # cite:t and cite:p must come before generic cite
-    result = _EVAL_RE.sub(_replace_eval, line)
-    result = _CITE_T_RE.sub(_replace_cite_t, result)
-    result = _CITE_P_RE.sub(_replace_cite_p, result)
-    result = _CITE_RE.sub(_replace_cite, result)
-    result = _NUMREF_RE.sub(_replace_numref, result)
-    result = _REF_RE.sub(_replace_ref, result)
-    result = _EQ_RE.sub(_replace_eq, result)
-    result = _DOC_RE.sub(_replace_doc, result)
+    # Apply all inline role transforms in one pass over the full line.
+    # The regex is specific enough ({role}`...`) that it will not match
+    # inside regular code spans (which lack the {role} prefix).
+    # Most lines contain no role at all; a substring test is far cheaper
+    # than entering the regex engine.
+    result = line
+    if "{" in result and "`" in result:
+        result = _INLINE_ROLE_RE.sub(_replace_role, result)
 
     # Rewrite remaining .md links to .qmd
-    result = _MD_LINK_RE.sub(r"\1.qmd\2", result)
+    if ".md" in result:
+        result = _MD_LINK_RE.sub(r"\1.qmd\2", result)
 
     return result
 
@@ -146,102 +142,16 @@ def _parse_tags(tags_str: str) -> list[str]:
 def transform_directive(frame: DirectiveFrame) -> list[str]:
     """Transform a single MyST directive to Quarto output lines.
 
+    Dispatches on the directive name through _DIRECTIVE_HANDLERS; unknown
+    directives pass through with a warning comment.
+
     Args:
         frame: The parsed directive frame.
 
     Returns:
         A list of output lines (without trailing newlines).
     """
-    name = frame.name
-
-    # ------------------------------------------------------------------
-    # code-cell
-    # ------------------------------------------------------------------
-    if name == "code-cell":
-        return _transform_code_cell(frame)
-
-    # ------------------------------------------------------------------
-    # figure
-    # ------------------------------------------------------------------
-    if name == "figure":
-        return _transform_figure(frame)
-
-    # ------------------------------------------------------------------
-    # math
-    # ------------------------------------------------------------------
-    if name == "math":
-        return _transform_math(frame)
-
-    # ------------------------------------------------------------------
-    # Admonitions: note, warning, tip, important, caution
-    # ------------------------------------------------------------------
-    if name in _ADMONITION_TYPES:
-        return _transform_admonition(frame, name)
-
-    # ------------------------------------------------------------------
-    # admonition (generic with custom title)
-    # ------------------------------------------------------------------
-    if name == "admonition":
-        return _transform_admonition(frame, "note", title=frame.argument)
-
-    # ------------------------------------------------------------------
-    # bibliography -> remove entirely
-    # ------------------------------------------------------------------
-    if name == "bibliography":
-        return []
-
-    # ------------------------------------------------------------------
-    # abstract -> remove from body (would go in frontmatter)
-    # ------------------------------------------------------------------
-    if name == "abstract":
-        return []
-
-    # ------------------------------------------------------------------
-    # tab-set
-    # ------------------------------------------------------------------
-    if name == "tab-set":
-        return _transform_tab_set(frame)
-
-    # ------------------------------------------------------------------
-    # tab-item
-    # ------------------------------------------------------------------
-    if name == "tab-item":
-        return _transform_tab_item(frame)
-
-    # ------------------------------------------------------------------
-    # margin
-    # ------------------------------------------------------------------
-    if name == "margin":
-        return _transform_margin(frame)
-
-    # ------------------------------------------------------------------
-    # image
-    # ------------------------------------------------------------------
-    if name == "image":
-        return _transform_image(frame)
-
-    # ------------------------------------------------------------------
-    # table
-    # ------------------------------------------------------------------
-    if name == "table":
-        return _transform_table(frame)
-
-    # ------------------------------------------------------------------
-    # tableofcontents -> remove entirely
-    # ------------------------------------------------------------------
-    if name == "tableofcontents":
-        return []
-
-    # ------------------------------------------------------------------
-    # mermaid -> pass through unchanged
-    # ------------------------------------------------------------------
-    if name == "mermaid":
-        return _transform_mermaid(frame)
-
-    # ------------------------------------------------------------------
-    # Unknown directive -> pass through with warning
-    # ------------------------------------------------------------------
-    return _transform_unknown(frame)
+    return _DIRECTIVE_HANDLERS.get(frame.name, _transform_unknown)(frame)
 
 
 def _transform_code_cell(frame: DirectiveFrame) -> list[str]:
@@ -418,6 +328,41 @@ def _transform_unknown(frame: DirectiveFrame) -> list[str]:
     return lines
 
 
+def _transform_removed(frame: DirectiveFrame) -> list[str]:
+    """Drop a directive that has no Quarto body equivalent."""
+    return []
+
+
+def _transform_typed_admonition(frame: DirectiveFrame) -> list[str]:
+    """Transform note, warning, tip, important and caution to callouts."""
+    return _transform_admonition(frame, frame.name)
+
+
+def _transform_titled_admonition(frame: DirectiveFrame) -> list[str]:
+    """Transform the generic admonition (custom title) to a note callout."""
+    return _transform_admonition(frame, "note", title=frame.argument)
+
+
+# Directive name -> transform. bibliography and tableofcontents are
+# generated by Quarto; abstract belongs in frontmatter, not the body.
+_DIRECTIVE_HANDLERS = {
+    "code-cell": _transform_code_cell,
+    "figure": _transform_figure,
+    "math": _transform_math,
+    **dict.fromkeys(_ADMONITION_TYPES, _transform_typed_admonition),
+    "admonition": _transform_titled_admonition,
+    "bibliography": _transform_removed,
+    "abstract": _transform_removed,
+    "tab-set": _transform_tab_set,
+    "tab-item": _transform_tab_item,
+    "margin": _transform_margin,
+    "image": _transform_image,
+    "table": _transform_table,
+    "tableofcontents": _transform_removed,
+    "mermaid": _transform_mermaid,
+}
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -432,6 +377,10 @@ def convert_myst_to_quarto(text: str) -> str:
     Returns:
         Quarto markdown text.
     """
+    # Directives and roles both need "{", and links ".md"; text with
+    # neither (plain prose) would come back unchanged
+    if "{" not in text and ".md" not in text:
+        return text
     scanner = Scanner(
         transform_fn=transform_directive,
         inline_fn=transform_inline,
@@ -8,73 +8,82 @@ import re
 # Inline transform patterns (Quarto -> MyST)
 # ---------------------------------------------------------------------------
 
-# `{python} expr` -> {eval}`expr`
-_INLINE_CODE_RE = re.compile(r"`\{python\}\s+([^`]+)`")
-
-# [@key1; @key2; ...] -> {cite}`key1,key2,...`  (multi-citation, must come first)
-_MULTI_CITE_RE = re.compile(r"\[(@[\w-]+(?:;\s*@[\w-]+)+)\]")
-
-# [@key] -> {cite}`key`  (single bracketed citation)
-_SINGLE_CITE_RE = re.compile(r"\[@([\w-]+)\]")
-
-# @fig-id -> {numref}`fig-id`  (figure cross-ref, must come before bare @)
-_FIG_REF_RE = re.compile(r"(?<!\w)@(fig-[\w-]+)(?!\w)")
-
-# @eq-label -> {eq}`label`  (equation cross-ref, must come before bare @)
-_EQ_REF_RE = re.compile(r"(?<!\w)@(eq-[\w-]+)(?!\w)")
-
-# @tbl-id -> {ref}`tbl-id`  (table cross-ref, must come before bare @)
-_TBL_REF_RE = re.compile(r"(?<!\w)@(tbl-[\w-]+)(?!\w)")
-
-# @sec-id -> {ref}`sec-id`  (section cross-ref, must come before bare @)
-_SEC_REF_RE = re.compile(r"(?<!\w)@(sec-[\w-]+)(?!\w)")
+# Every inline construct except doc links, matched in a single left-to-right
+# pass. Each alternative sets one named group, dispatched on m.lastgroup:
+#   code:  `{python} expr` -> {eval}`expr`
+#   cite:  [@key] or [@key1; @key2; ...] -> {cite}`key1,key2,...`
+#   fig:   @fig-id -> {numref}`fig-id`
+#   eq:    @eq-label -> {eq}`eq-label`
+#   tbl:   @tbl-id -> {ref}`tbl-id`
+#   sec:   @sec-id -> {ref}`sec-id`
+#   bare:  @key -> {cite:t}`key` (bare citation, not @fig/@eq/@tbl/@sec)
+# Cross-refs and bare citations must NOT be preceded by a word character
+# (to exclude emails).
+_INLINE_RE = re.compile(
+    r"`\{python\}\s+(?P<code>[^`]+)`"
+    r"|\[(?P<cite>@[\w-]+(?:;\s*@[\w-]+)*)\]"
+    r"|(?<!\w)@(?P<fig>fig-[\w-]+)(?!\w)"
+    r"|(?<!\w)@(?P<eq>eq-[\w-]+)(?!\w)"
+    r"|(?<!\w)@(?P<tbl>tbl-[\w-]+)(?!\w)"
+    r"|(?<!\w)@(?P<sec>sec-[\w-]+)(?!\w)"
+    r"|(?<!\w)@(?P<bare>(?!fig-|eq-|tbl-|sec-)[\w][\w-]*)(?!\w)"
+)
 
-# @key (bare citation, not email, not @fig/@eq/@tbl/@sec) -> {cite:t}`key`
-# Must NOT be preceded by a word character (to exclude emails).
-# Must NOT match @fig-*, @eq-*, @tbl-*, @sec-* (those are handled above).
-_BARE_CITE_RE = re.compile(r"(?<!\w)@((?!fig-|eq-|tbl-|sec-)[\w][\w-]*)(?!\w)")
+# One key inside a bracketed citation: @key
+_CITE_KEY_RE = re.compile(r"@([\w-]+)")
 
 # [text](path.qmd) where link text matches the path stem -> {doc}`path`
 _DOC_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^\)]+\.qmd)\)")
 
+# Block syntax patterns match with re.ASCII: option keys, engine names and
+# markup whitespace are 7-bit, so ASCII classes are both cheaper and stricter.
+# Patterns capturing user-chosen labels (eq/tbl/image ids) and the inline
+# patterns above keep Unicode \w, since Pandoc allows non-ASCII keys.
+
 # Quarto cell option pattern: #| key: value
-_CELL_OPTION_RE = re.compile(r"^#\|\s+([\w-]+):\s+(.+)$")
+_CELL_OPTION_RE = re.compile(r"^#\|\s+([\w-]+):\s+(.+)$", re.ASCII)
 
 # Quarto callout pattern: ::: {.callout-TYPE} or ::: {.callout-TYPE title="..."}
 _CALLOUT_RE = re.compile(
     r"^(:{3,})\s*\{\.callout-(note|warning|tip|important|caution)"
-    r'(?:\s+title="([^"]*)")?\s*\}'
+    r'(?:\s+title="([^"]*)")?\s*\}',
+    re.ASCII,
 )
 
 # Quarto panel-tabset pattern
-_TABSET_RE = re.compile(r"^(:{3,})\s*\{\.panel-tabset\}")
+_TABSET_RE = re.compile(r"^(:{3,})\s*\{\.panel-tabset\}", re.ASCII)
 
 # Quarto column-margin pattern
-_MARGIN_RE = re.compile(r"^(:{3,})\s*\{\.column-margin\}")
+_MARGIN_RE = re.compile(r"^(:{3,})\s*\{\.column-margin\}", re.ASCII)
 
 # Quarto executable code block: ```{python}, ```{r}, ```{julia}, etc.
-_EXEC_CODE_RE = re.compile(r"^(`{3,})\{(\w+)\}\s*$")
-
-# Closing fence for colon blocks
-_COLON_CLOSE_RE = re.compile(r"^(:{3,})\s*$")
-
-# Closing fence for backtick blocks
-_BACKTICK_CLOSE_RE = re.compile(r"^(`{3,})\s*$")
+_EXEC_CODE_RE = re.compile(r"^(`{3,})\{(\w+)\}\s*$", re.ASCII)
 
 # Image/figure with attributes: ![alt](url){attrs}
-_IMG_ATTRS_RE = re.compile(r"^!\[([^\]]*)\]\(([^)]+)\)\{([^}]+)\}\s*$")
+_IMG_ATTRS_RE = re.compile(r"^!\[([^\]]*)\]\(([^)]+)\)\{([^}]+)\}\s*$", re.ASCII)
 
 # Math block closing with label: $$ {#eq-id}
 _MATH_CLOSE_LABEL_RE = re.compile(r"^\$\$\s*\{#([\w-]+)\}\s*$")
 
 # Math block opening: $$
-_MATH_OPEN_RE = re.compile(r"^\$\$\s*$")
+_MATH_OPEN_RE = re.compile(r"^\$\$\s*$", re.ASCII)
 
 # Table caption line: : Caption {#tbl-id}
 _TABLE_CAPTION_RE = re.compile(r"^:\s+(.+?)\s*\{#(tbl-[\w-]+)\}\s*$")
 
 # Table row pattern (to detect table blocks for caption association)
-_TABLE_ROW_RE = re.compile(r"^\|.*\|\s*$")
+_TABLE_ROW_RE = re.compile(r"^\|.*\|\s*$", re.ASCII)
+
+# Image attributes: #id and width="value" (or width=value)
+_IMG_ID_RE = re.compile(r"#([\w-]+)")
+_IMG_WIDTH_RE = re.compile(r'width="?([^"\s}]+)"?', re.ASCII)
+
+# Tab heading inside a panel-tabset: ## Label
+_TAB_HEADING_RE = re.compile(r"^##\s+(.+)$", re.ASCII)
+
+# First characters of the block constructs above: ``` fences, ::: divs and
+# table captions, ![...] images, $$ math, | table rows
+_BLOCK_START_CHARS = frozenset("`:!$|")
 
 # Quarto cell option -> MyST tag mapping (reverse of myst_to_quarto._TAG_MAP)
 _OPTION_TO_TAG = {
@@ -96,39 +105,25 @@ _EXEC_LANGUAGES = {"python", "r", "julia", "bash", "sh", "sql", "ojs", "dot", "m
 # ---------------------------------------------------------------------------
 
 
-def _replace_inline_code(m: re.Match) -> str:
-    return f"{{eval}}`{m.group(1)}`"
-
-
-def _replace_multi_cite(m: re.Match) -> str:
-    # Extract keys from "@key1; @key2; @key3"
-    raw = m.group(1)
-    keys = [k.strip().lstrip("@") for k in raw.split(";")]
-    return "{cite}`" + ",".join(keys) + "`"
-
-
-def _replace_single_cite(m: re.Match) -> str:
-    return "{cite}`" + m.group(1) + "`"
-
-
-def _replace_fig_ref(m: re.Match) -> str:
-    return "{numref}`" + m.group(1) + "`"
-
-
-def _replace_eq_ref(m: re.Match) -> str:
-    return "{eq}`" + m.group(1) + "`"
-
-
-def _replace_tbl_ref(m: re.Match) -> str:
-    return "{ref}`" + m.group(1) + "`"
-
-
-def _replace_sec_ref(m: re.Match) -> str:
-    return "{ref}`" + m.group(1) + "`"
+# _INLINE_RE group name -> MyST role wrapping the group's text
+_INLINE_ROLES = {
+    "code": "eval",
+    "cite": "cite",
+    "fig": "numref",
+    "eq": "eq",
+    "tbl": "ref",
+    "sec": "ref",
+    "bare": "cite:t",
+}
 
 
-def _replace_bare_cite(m: re.Match) -> str:
-    return "{cite:t}`" + m.group(1) + "`"
+def _replace_inline(m: re.Match) -> str:
+    group = m.lastgroup
+    text = m[group]
+    if group == "cite":
+        # Extract keys from "@key1; @key2; @key3" (or a single "@key")
+        text = ",".join(_CITE_KEY_RE.findall(text))
+    return "{" + _INLINE_ROLES[group] + "}`" + text + "`"
 
 
 def _replace_doc_link(m: re.Match) -> str:
@@ -152,28 +147,19 @@ def transform_quarto_inline(line: str) -> str:
     if not line:
         return line
 
-    # Order matters: more specific patterns must come before less specific ones.
+    # Each pass needs a marker substring; most prose lines have none, and a
+    # substring test is far cheaper than entering the regex engine.
+    result = line
 
-    # 1. Inline executable code: `{python} expr` -> {eval}`expr`
-    result = _INLINE_CODE_RE.sub(_replace_inline_code, line)
+    # 1. Inline code, citations and cross-refs in one pass. At any position
+    #    the alternatives are tried in order, so cross-refs win over bare
+    #    citations.
+    if "@" in result or "`{python}" in result:
+        result = _INLINE_RE.sub(_replace_inline, result)
 
-    # 2. Multi-citation: [@a; @b; @c] -> {cite}`a,b,c`
-    result = _MULTI_CITE_RE.sub(_replace_multi_cite, result)
-
-    # 3. Single bracketed citation: [@key] -> {cite}`key`
-    result = _SINGLE_CITE_RE.sub(_replace_single_cite, result)
-
-    # 4. Cross-refs (before bare citation, since @fig-* etc. start with @)
-    result = _FIG_REF_RE.sub(_replace_fig_ref, result)
-    result = _EQ_REF_RE.sub(_replace_eq_ref, result)
-    result = _TBL_REF_RE.sub(_replace_tbl_ref, result)
-    result = _SEC_REF_RE.sub(_replace_sec_ref, result)
-
-    # 5. Bare citation: @key -> {cite:t}`key`
-    result = _BARE_CITE_RE.sub(_replace_bare_cite, result)
-
-    # 6. Doc links: [text](file.qmd) -> {doc}`path`
-    result = _DOC_LINK_RE.sub(_replace_doc_link, result)
+    # 2. Doc links: [text](file.qmd) -> {doc}`path`
+    if ".qmd)" in result:
+        result = _DOC_LINK_RE.sub(_replace_doc_link, result)
 
     return result
 
@@ -192,16 +178,14 @@ def _parse_cell_options(
         Tuple of (options_dict, remaining_body_lines).
     """
     options: dict[str, str] = {}
+    n = len(body_lines)
     i = 0
-    for i, line in enumerate(body_lines):
-        m = _CELL_OPTION_RE.match(line.strip())
-        if m:
-            options[m.group(1)] = m.group(2).strip()
-        else:
+    while i < n:
+        m = _CELL_OPTION_RE.match(body_lines[i].strip())
+        if m is None:
             break
-    else:
-        # All lines were options
-        i = len(body_lines)
+        options[m.group(1)] = m.group(2).strip()
+        i += 1
 
     remaining = body_lines[i:]
     # Strip leading blank line after options
@@ -270,32 +254,24 @@ def _build_tab_set(body_lines: list[str]) -> list[str]:
     """
     result: list[str] = ["::::{tab-set}"]
 
-    # Split body into tab items based on ## headings
-    current_label = None
-    current_body: list[str] = []
-
-    for line in body_lines:
-        heading_m = re.match(r"^##\s+(.+)$", line)
-        if heading_m:
-            # Flush previous tab item
-            if current_label is not None:
-                # Remove trailing blank lines from previous tab body
-                while current_body and current_body[-1].strip() == "":
-                    current_body.pop()
-                result.append(f":::{{tab-item}} {current_label}")
-                result.extend(current_body)
-                result.append(":::")
-            current_label = heading_m.group(1).strip()
-            current_body = []
-        else:
-            current_body.append(line)
-
-    # Flush last tab item
-    if current_label is not None:
-        while current_body and current_body[-1].strip() == "":
-            current_body.pop()
-        result.append(f":::{{tab-item}} {current_label}")
-        result.extend(current_body)
+    # Find the ## headings that start each tab item; lines before the first
+    # heading belong to no tab and are dropped
+    headings: list[tuple[int, str]] = []
+    for idx, line in enumerate(body_lines):
+        if line.startswith("##"):
+            heading_m = _TAB_HEADING_RE.match(line)
+            if heading_m:
+                headings.append((idx, heading_m.group(1).strip()))
+
+    # Each tab body runs from its heading to the next one
+    ends = [idx for idx, _ in headings[1:]]
+    ends.append(len(body_lines))
+    for (start, label), end in zip(headings, ends):
+        # Remove trailing blank lines from the tab body
+        while end > start + 1 and body_lines[end - 1].strip() == "":
+            end -= 1
+        result.append(f":::{{tab-item}} {label}")
+        result.extend(body_lines[start + 1 : end])
         result.append(":::")
 
     result.append("::::")
@@ -307,12 +283,12 @@ def _parse_image_attrs(attr_str: str) -> dict[str, str]:
     attrs: dict[str, str] = {}
 
     # Find #id
-    id_m = re.search(r"#([\w-]+)", attr_str)
+    id_m = _IMG_ID_RE.search(attr_str)
     if id_m:
         attrs["id"] = id_m.group(1)
 
     # Find width="value" or width=value
-    width_m = re.search(r'width="?([^"\s}]+)"?', attr_str)
+    width_m = _IMG_WIDTH_RE.search(attr_str)
     if width_m:
         attrs["width"] = width_m.group(1)
 
@@ -373,6 +349,35 @@ def _build_table_directive(
 # ---------------------------------------------------------------------------
 
 
+def _collect_until_close(
+    input_lines: list[str], start: int, fence_char: str, fence_count: int
+) -> tuple[list[str], int]:
+    """Collect block body lines up to a closing fence of fence_count or more.
+
+    A closing fence is a line of only fence_char (at least fence_count of
+    them) and surrounding whitespace.
+
+    Args:
+        input_lines: All document lines.
+        start: Index of the first body line.
+        fence_char: "`" or ":".
+        fence_count: Length of the opening fence.
+
+    Returns:
+        Tuple of (body_lines, index of the line after the closing fence).
+    """
+    i = start
+    n = len(input_lines)
+    while i < n:
+        line = input_lines[i]
+        if fence_char in line:
+            fence = line.strip()
+            if len(fence) >= fence_count and not fence.lstrip(fence_char):
+                break
+        i += 1
+    return input_lines[start:i], i + 1
+
+
 def transform_quarto_block(lines: list[str]) -> list[str]:
     """Process a block of Quarto lines, detecting callouts, tabsets, etc.
 
@@ -382,9 +387,7 @@ def transform_quarto_block(lines: list[str]) -> list[str]:
     Returns:
         List of transformed output lines.
     """
-    text = "\n".join(lines)
-    result = convert_quarto_to_myst(text)
-    return result.split("\n")
+    return _convert_lines(lines)
 
 
 def convert_quarto_to_myst(text: str) -> str:
@@ -406,22 +409,66 @@ def convert_quarto_to_myst(text: str) -> str:
     Returns:
         MyST markdown text.
     """
-    input_lines = text.split("\n")
+    # Every construct above needs one of these substrings (unlabeled $$
+    # blocks are normalized too); without them the text is returned as-is
+    if not ("{" in text or "@" in text or "$$" in text or ".qmd" in text):
+        return text
+    return "\n".join(_convert_lines(text.split("\n")))
+
+
+def _convert_lines(input_lines: list[str]) -> list[str]:
+    """Convert Quarto lines to MyST lines (see convert_quarto_to_myst).
+
+    Args:
+        input_lines: Document lines, without trailing newlines.
+
+    Returns:
+        Converted lines, without trailing newlines.
+    """
     output_lines: list[str] = []
+    emit = output_lines.append
+    inline = transform_quarto_inline
+    n = len(input_lines)
+
+    # Bind the block patterns' match methods once for the line loop
+    match_exec = _EXEC_CODE_RE.match
+    match_callout = _CALLOUT_RE.match
+    match_tabset = _TABSET_RE.match
+    match_margin = _MARGIN_RE.match
+    match_img = _IMG_ATTRS_RE.match
+    match_math_open = _MATH_OPEN_RE.match
+    match_math_close_label = _MATH_CLOSE_LABEL_RE.match
+    match_table_caption = _TABLE_CAPTION_RE.match
+    match_table_row = _TABLE_ROW_RE.match
 
     i = 0
-    # Track accumulated table lines for caption association
-    table_lines_buffer: list[str] = []
-    in_table = False
+    # Index in output_lines of the current table's first row, for
+    # caption association (None when not in a table)
+    table_start: int | None = None
 
-    while i < len(input_lines):
+    while i < n:
         line = input_lines[i]
+        if not line:
+            # Blank lines neither end a table nor need any transform
+            emit(line)
+            i += 1
+            continue
         stripped = line.strip()
 
+        # Every block construct below starts with one of a few characters;
+        # other lines (most prose) go straight to the inline transforms
+        if stripped[:1] not in _BLOCK_START_CHARS:
+            if table_start is not None and stripped != "":
+                # Non-table, non-blank line -> end of table
+                table_start = None
+            emit(inline(line))
+            i += 1
+            continue
+
         # ----------------------------------------------------------
         # Check for executable code block: ```{python}, ```{r}, etc.
         # ----------------------------------------------------------
-        exec_m = _EXEC_CODE_RE.match(stripped)
+        exec_m = match_exec(stripped)
         if exec_m:
             fence_str = exec_m.group(1)
             lang = exec_m.group(2)
@@ -429,26 +476,20 @@ def convert_quarto_to_myst(text: str) -> str:
 
             if lang.lower() in _EXEC_LANGUAGES:
                 # Collect body until closing fence
-                body_lines: list[str] = []
-                i += 1
-                while i < len(input_lines):
-                    close_m = _BACKTICK_CLOSE_RE.match(input_lines[i].strip())
-                    if close_m and len(close_m.group(1)) >= fence_count:
-                        break
-                    body_lines.append(input_lines[i])
-                    i += 1
+                body_lines, i = _collect_until_close(
+                    input_lines, i + 1, "`", fence_count
+                )
 
                 # Parse cell options from body
                 options, remaining_body = _parse_cell_options(body_lines)
                 cell_lines = _build_code_cell(lang, options, remaining_body)
                 output_lines.extend(cell_lines)
-                i += 1  # skip closing fence
                 continue
 
         # ----------------------------------------------------------
         # Check for callout: ::: {.callout-*}
         # ----------------------------------------------------------
-        callout_m = _CALLOUT_RE.match(stripped)
+        callout_m = match_callout(stripped)
         if callout_m:
             fence_str = callout_m.group(1)
             adm_type = callout_m.group(2)
@@ -456,70 +497,46 @@ def convert_quarto_to_myst(text: str) -> str:
             fence_count = len(fence_str)
 
             # Collect body until closing :::
-            body_lines = []
-            i += 1
-            while i < len(input_lines):
-                close_m = _COLON_CLOSE_RE.match(input_lines[i].strip())
-                if close_m and len(close_m.group(1)) >= fence_count:
-                    break
-                body_lines.append(input_lines[i])
-                i += 1
+            body_lines, i = _collect_until_close(input_lines, i + 1, ":", fence_count)
 
             adm_lines = _build_admonition(adm_type, title, body_lines)
             output_lines.extend(adm_lines)
-            i += 1  # skip closing fence
             continue
 
         # ----------------------------------------------------------
         # Check for panel-tabset: ::: {.panel-tabset}
         # ----------------------------------------------------------
-        tabset_m = _TABSET_RE.match(stripped)
+        tabset_m = match_tabset(stripped)
         if tabset_m:
             fence_str = tabset_m.group(1)
             fence_count = len(fence_str)
 
             # Collect body until closing :::
-            body_lines = []
-            i += 1
-            while i < len(input_lines):
-                close_m = _COLON_CLOSE_RE.match(input_lines[i].strip())
-                if close_m and len(close_m.group(1)) >= fence_count:
-                    break
-                body_lines.append(input_lines[i])
-                i += 1
+            body_lines, i = _collect_until_close(input_lines, i + 1, ":", fence_count)
 
             tab_lines = _build_tab_set(body_lines)
             output_lines.extend(tab_lines)
-            i += 1  # skip closing fence
             continue
 
         # ----------------------------------------------------------
         # Check for column-margin: ::: {.column-margin}
         # ----------------------------------------------------------
-        margin_m = _MARGIN_RE.match(stripped)
+        margin_m = match_margin(stripped)
         if margin_m:
             fence_str = margin_m.group(1)
             fence_count = len(fence_str)
 
             # Collect body until closing :::
-            body_lines = []
-            i += 1
-            while i < len(input_lines):
-                close_m = _COLON_CLOSE_RE.match(input_lines[i].strip())
-                if close_m and len(close_m.group(1)) >= fence_count:
-                    break
-                body_lines.append(input_lines[i])
-                i += 1
+            body_lines, i = _collect_until_close(input_lines, i + 1, ":", fence_count)
 
             margin_lines = _build_margin(body_lines)
             output_lines.extend(margin_lines)
-            i += 1  # skip closing fence
             continue
 
         # ----------------------------------------------------------
         # Check for image/figure with attributes: ![alt](url){attrs}
         # ----------------------------------------------------------
-        img_m = _IMG_ATTRS_RE.match(stripped)
+        img_m = match_img(stripped)
         if img_m:
             alt = img_m.group(1)
             url = img_m.group(2)
@@ -536,7 +553,7 @@ def convert_quarto_to_myst(text: str) -> str:
                 output_lines.extend(img_lines)
             else:
                 # No meaningful attributes, pass through
-                output_lines.append(transform_quarto_inline(line))
+                emit(inline(line))
 
             i += 1
             continue
@@ -544,18 +561,19 @@ def convert_quarto_to_myst(text: str) -> str:
         # ----------------------------------------------------------
         # Check for math block: $$
         # ----------------------------------------------------------
-        if _MATH_OPEN_RE.match(stripped):
+        if match_math_open(stripped):
             # Collect lines until $$ or $$ {#eq-id}
             math_body: list[str] = []
             label = ""
             i += 1
-            while i < len(input_lines):
+            while i < n:
                 math_line = input_lines[i]
-                label_m = _MATH_CLOSE_LABEL_RE.match(math_line.strip())
+                math_stripped = math_line.strip()
+                label_m = match_math_close_label(math_stripped)
                 if label_m:
                     label = label_m.group(1)
                     break
-                if _MATH_OPEN_RE.match(math_line.strip()):
+                if match_math_open(math_stripped):
                     # Plain $$ close
                     break
                 math_body.append(math_line)
@@ -567,9 +585,9 @@ def convert_quarto_to_myst(text: str) -> str:
                 output_lines.extend(math_lines)
             else:
                 # No label, pass through as-is
-                output_lines.append("$$")
+                emit("$$")
                 output_lines.extend(math_body)
-                output_lines.append("$$")
+                emit("$$")
 
             i += 1
             continue
@@ -577,46 +595,42 @@ def convert_quarto_to_myst(text: str) -> str:
         # ----------------------------------------------------------
         # Check for table caption: : Caption {#tbl-id}
         # ----------------------------------------------------------
-        table_caption_m = _TABLE_CAPTION_RE.match(stripped)
-        if table_caption_m and in_table:
+        table_caption_m = match_table_caption(stripped)
+        if table_caption_m and table_start is not None:
             caption = table_caption_m.group(1).strip()
             name = table_caption_m.group(2)
 
-            # Wrap the buffered table lines in a table directive
-            tbl_lines = _build_table_directive(caption, name, table_lines_buffer)
-
-            # Replace the table lines in output with the directive
-            # Remove the raw table lines we already added
-            for _ in range(len(table_lines_buffer)):
-                output_lines.pop()
-            output_lines.extend(tbl_lines)
+            # Replace the table lines already in output with a table
+            # directive wrapping them (minus blank lines before the caption)
+            table_lines = output_lines[table_start:]
+            while table_lines and table_lines[-1].strip() == "":
+                table_lines.pop()
+            output_lines[table_start:] = _build_table_directive(
+                caption, name, table_lines
+            )
 
-            table_lines_buffer = []
-            in_table = False
+            table_start = None
             i += 1
             continue
 
         # ----------------------------------------------------------
         # Track table rows for caption association
         # ----------------------------------------------------------
-        if _TABLE_ROW_RE.match(stripped):
-            if not in_table:
-                in_table = True
-                table_lines_buffer = []
-            table_lines_buffer.append(line)
-            output_lines.append(line)
+        if match_table_row(stripped):
+            if table_start is None:
+                table_start = len(output_lines)
+            emit(line)
             i += 1
             continue
         else:
-            if in_table and stripped != "":
+            if table_start is not None and stripped != "":
                 # Non-table, non-blank line -> end of table
-                in_table = False
-                table_lines_buffer = []
+                table_start = None
 
         # ----------------------------------------------------------
         # Regular line: apply inline transforms
         # ----------------------------------------------------------
-        output_lines.append(transform_quarto_inline(line))
+        emit(inline(line))
         i += 1
 
-    return "\n".join(output_lines)
+    return output_lines
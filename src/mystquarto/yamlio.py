@@ -0,0 +1,161 @@
+"""YAML loading and dumping, using PyYAML's libyaml bindings when available."""
+
+from __future__ import annotations
+
+import io
+import re
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+# Emitter options shared by every dump: block style, original key order,
+# non-ASCII text (e.g. author names) written as-is rather than escaped
+_DUMP_OPTIONS = {"default_flow_style": False, "sort_keys": False, "allow_unicode": True}
+
+# Scalars the emitter always writes plain (unquoted): start with a letter,
+# contain no indicator characters (":", "#", quotes, brackets, ...), and do
+# not end in a space.
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z](?:[\w .,()/-]*[\w.)])?", re.ASCII)
+
+# Words YAML resolves to booleans or null, which must be quoted as strings
+_RESERVED_WORDS = frozenset(
+    {"yes", "no", "true", "false", "on", "off", "null", "y", "n"}
+)
+
+# Longest "key: value" line written by the fast path; longer plain scalars
+# may be folded by the emitter
+_MAX_SIMPLE_LINE = 80
+
+# Keys this long or longer may be written by the emitter as "? key" complex
+# keys (libyaml's limit is 128 characters; PyYAML's pure-Python emitter also
+# counts the 5-character "!!str" tag), so the fast path leaves them to the
+# dumper
+_MAX_SIMPLE_KEY = 123
+
+
+def load_yaml(stream: str | bytes | IO[str]) -> Any:
+    """Parse YAML text, encoded bytes or a text stream with the safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def _format_simple_scalar(value: Any) -> str | None:
+    """Render a scalar exactly as the dumper would, if that is trivial."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if (
+        isinstance(value, str)
+        and _PLAIN_SCALAR_RE.fullmatch(value)
+        and value.lower() not in _RESERVED_WORDS
+    ):
+        return value
+    return None
+
+
+def _emit_simple_mapping(
+    data: dict, indent: str, lines: list[str], seen: set[int]
+) -> bool:
+    """Append block-style lines for a mapping; False if it is not simple."""
+    if not data or id(data) in seen:
+        return False
+    seen.add(id(data))
+    for key, value in data.items():
+        key_text = _format_simple_scalar(key) if isinstance(key, str) else None
+        if key_text is None or len(key_text) >= _MAX_SIMPLE_KEY:
+            return False
+        if isinstance(value, dict):
+            lines.append(f"{indent}{key_text}:\n")
+            if not _emit_simple_mapping(value, indent + "  ", lines, seen):
+                return False
+        elif isinstance(value, list):
+            # Block sequences are not indented under their key
+            lines.append(f"{indent}{key_text}:\n")
+            if not _emit_simple_sequence(value, indent, lines, seen):
+                return False
+        else:
+            value_text = _format_simple_scalar(value)
+            if value_text is None:
+                return False
+            line = f"{indent}{key_text}: {value_text}\n"
+            if len(line) > _MAX_SIMPLE_LINE:
+                return False
+            lines.append(line)
+    return True
+
+
+def _emit_simple_sequence(
+    items: list, indent: str, lines: list[str], seen: set[int]
+) -> bool:
+    """Append block-style lines for a sequence; False if it is not simple."""
+    if not items or id(items) in seen:
+        return False
+    seen.add(id(items))
+    for item in items:
+        if isinstance(item, dict):
+            # The first key goes on the "- " line, the rest align under it
+            first = len(lines)
+            if not _emit_simple_mapping(item, indent + "  ", lines, seen):
+                return False
+            lines[first] = f"{indent}- {lines[first][len(indent) + 2 :]}"
+        elif isinstance(item, list):
+            return False
+        else:
+            item_text = _format_simple_scalar(item)
+            if item_text is None:
+                return False
+            line = f"{indent}- {item_text}\n"
+            if len(line) > _MAX_SIMPLE_LINE:
+                return False
+            lines.append(line)
+    return True
+
+
+def _dump_simple_mapping(data: Any) -> str | None:
+    """Emit a mapping of plain keys and scalars without the dumper.
+
+    Frontmatter and configs are mostly short string fields, nested
+    mappings (book, kernelspec) and lists of names or author records. This
+    writes exactly what the dumper would for that shape, and returns None
+    for anything else: empty or repeated containers (which the dumper
+    writes in flow style or with anchors), lists of lists, scalars that
+    need quoting or could be line-folded, and keys long enough to be
+    written as complex keys.
+    """
+    if not isinstance(data, dict):
+        return None
+    lines: list[str] = []
+    if not _emit_simple_mapping(data, "", lines, set()):
+        return None
+    return "".join(lines)
+
+
+def dump_yaml(data: Any, stream: IO[str] | None = None) -> str | None:
+    """Serialize data as block-style YAML, preserving key order.
+
+    Drives the dumper directly rather than through yaml.dump, which
+    re-parses its keyword arguments and wraps the data for dump_all on
+    every call.
+
+    Returns the YAML text when no stream is given.
+    """
+    if stream is None:
+        simple = _dump_simple_mapping(data)
+        if simple is not None:
+            return simple
+
+    buffer = io.StringIO() if stream is None else None
+    dumper = SafeDumper(stream if buffer is None else buffer, **_DUMP_OPTIONS)
+    try:
+        dumper.open()
+        dumper.represent(data)
+        dumper.close()
+    finally:
+        dumper.dispose()
+    return buffer.getvalue() if buffer is not None else None
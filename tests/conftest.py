@@ -1,12 +1,32 @@
 """Shared test fixtures for mystquarto tests."""
 
+import shutil
+
 import pytest
 import yaml
+from click.testing import CliRunner
 
 
-@pytest.fixture
-def myst_project(tmp_path):
-    """Create a temporary MyST project with .md files and myst.yml."""
+@pytest.fixture(scope="module")
+def cli_runner():
+    """A Click test runner shared by the tests of one module."""
+    return CliRunner()
+
+
+def _instantiate(template, tmp_path):
+    """Populate tmp_path with a copy of a session-wide project template.
+
+    Files are real copies, so tests may rewrite them freely without
+    affecting other tests.
+    """
+    shutil.copytree(template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def _myst_project_template(tmp_path_factory):
+    """Build the MyST project once per test session."""
+    tmp_path = tmp_path_factory.mktemp("myst_project")
     # Create myst.yml config
     myst_config = {
         "project": {
@@ -55,8 +75,15 @@ def myst_project(tmp_path):
 
 
 @pytest.fixture
-def quarto_project(tmp_path):
-    """Create a temporary Quarto project with .qmd files and _quarto.yml."""
+def myst_project(_myst_project_template, tmp_path):
+    """Create a temporary MyST project with .md files and myst.yml."""
+    return _instantiate(_myst_project_template, tmp_path)
+
+
+@pytest.fixture(scope="session")
+def _quarto_project_template(tmp_path_factory):
+    """Build the Quarto project once per test session."""
+    tmp_path = tmp_path_factory.mktemp("quarto_project")
     # Create _quarto.yml config
     quarto_config = {
         "project": {"type": "book"},
@@ -95,3 +122,9 @@ def quarto_project(tmp_path):
     script.write_text("# Python helper\nprint('hello')\n")
 
     return tmp_path
+
+
+@pytest.fixture
+def quarto_project(_quarto_project_template, tmp_path):
+    """Create a temporary Quarto project with .qmd files and _quarto.yml."""
+    return _instantiate(_quarto_project_template, tmp_path)
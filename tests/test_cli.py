@@ -4,13 +4,14 @@ import os
 
 import pytest
 import yaml
-from click.testing import CliRunner
 
 from mystquarto.cli import main, myst2quarto, quarto2myst
 from mystquarto.convert import (
     Direction,
     convert_directory,
     convert_file,
+    convert_text,
+    discover_all,
     discover_files,
 )
 from mystquarto.warnings import WarningCollector
@@ -143,11 +144,74 @@ class TestDiscoverFiles:
         assert "doc.md" in filenames
         assert "myst.yml" not in filenames
 
+    def test_discover_nested_and_skipped_dirs(self, tmp_path):
+        """Descends into subdirectories but prunes build/tooling dirs."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "a" / "b" / "deep.md").write_text("# Deep\n")
+        (tmp_path / "_build").mkdir()
+        (tmp_path / "_build" / "built.md").write_text("# Built\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "readme.md").write_text("# Pkg\n")
+        (tmp_path / "top.md").write_text("# Top\n")
+
+        files = discover_files(str(tmp_path), Direction.MYST_TO_QUARTO)
+
+        assert files == [
+            os.path.join(str(tmp_path), "a", "b", "deep.md"),
+            os.path.join(str(tmp_path), "top.md"),
+        ]
+
+    def test_discover_all_groups_files(self, myst_project):
+        """One traversal sorts files into markdown, config and asset lists."""
+        (myst_project / "other.qmd").write_text("# Quarto\n")
+        found = discover_all(str(myst_project), Direction.MYST_TO_QUARTO)
+
+        assert [os.path.basename(f) for f in found.config_files] == ["myst.yml"]
+        assert [os.path.basename(f) for f in found.md_files] == [
+            "chapter1.md",
+            "intro.md",
+            "methods.md",
+        ]
+        # Files of the other format are neither converted nor copied
+        assert [os.path.basename(f) for f in found.asset_files] == ["helper.py"]
+
+    def test_only_config_sidecars_are_hidden(self, myst_project):
+        """Sidecars next to a config are hidden; other .cache.json files are not."""
+        (myst_project / "_quarto.yml").write_text("title: Generated\n")
+        (myst_project / "_quarto.yml.cache.json").write_text("{}")
+        (myst_project / "data").mkdir()
+        (myst_project / "data" / "results.cache.json").write_text("{}")
+        (myst_project / "data" / "myst.yml.cache.json").write_text("{}")
+
+        found = discover_all(str(myst_project), Direction.MYST_TO_QUARTO)
+
+        assert sorted(os.path.relpath(f, myst_project) for f in found.asset_files) == [
+            os.path.join("data", "myst.yml.cache.json"),
+            os.path.join("data", "results.cache.json"),
+            "helper.py",
+        ]
+
     def test_discover_empty_directory(self, tmp_path):
         """Returns empty list for directory with no relevant files."""
         files = discover_files(str(tmp_path), Direction.MYST_TO_QUARTO)
         assert files == []
 
+    def test_discovery_does_not_import_yaml(self, myst_project):
+        """Scanning a directory does not load the YAML-based config module."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from mystquarto.convert import Direction, discover_all\n"
+            f"discover_all({str(myst_project)!r}, Direction.MYST_TO_QUARTO)\n"
+            "print('yaml' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
 
 # ============================================================================
 # Convert file tests
@@ -222,6 +286,49 @@ class TestConvertFile:
         # kernelspec should be converted to jupyter
         assert "kernelspec" not in content
 
+    def test_convert_file_skips_up_to_date_output(self, tmp_path):
+        """An output newer than its input is left alone unless forced."""
+        input_file = tmp_path / "doc.md"
+        input_file.write_text("See {cite}`smith2020`.\n")
+        output_file = tmp_path / "doc.qmd"
+        output_file.write_text("already converted\n")
+        input_stat = os.stat(input_file)
+        os.utime(output_file, ns=(input_stat.st_atime_ns, input_stat.st_mtime_ns + 1))
+
+        result = convert_file(
+            str(input_file), str(output_file), Direction.MYST_TO_QUARTO
+        )
+        assert result.skipped
+        assert output_file.read_text() == "already converted\n"
+
+        result = convert_file(
+            str(input_file), str(output_file), Direction.MYST_TO_QUARTO, force=True
+        )
+        assert not result.skipped
+        assert "[@smith2020]" in output_file.read_text()
+
+    def test_convert_file_windows_newlines(self, tmp_path):
+        """CRLF and CR line endings are read as plain newlines."""
+        input_file = tmp_path / "doc.md"
+        input_file.write_bytes(b"---\r\ntitle: Doc\r\n---\r\nSee {cite}`a`.\rEnd\r\n")
+        output_file = tmp_path / "doc.qmd"
+
+        convert_file(str(input_file), str(output_file), Direction.MYST_TO_QUARTO)
+
+        content = output_file.read_bytes().decode("utf-8")
+        assert "\r" not in content
+        assert content == "---\ntitle: Doc\n---\nSee [@a].\nEnd\n"
+
+    def test_convert_file_not_utf8(self, tmp_path):
+        """Undecodable input is reported as an error, not raised."""
+        input_file = tmp_path / "doc.md"
+        input_file.write_bytes(b"# Caf\xe9\n")
+
+        result = convert_file(
+            str(input_file), str(tmp_path / "doc.qmd"), Direction.MYST_TO_QUARTO
+        )
+        assert len(result.errors) > 0
+
     def test_convert_file_nonexistent(self, tmp_path):
         """Converting a nonexistent file produces an error."""
         result = convert_file(
@@ -232,6 +339,22 @@ class TestConvertFile:
         assert len(result.errors) > 0
 
 
+class TestConvertText:
+    """Tests for in-memory document conversion."""
+
+    def test_myst_to_quarto(self):
+        """Frontmatter and body are both converted."""
+        text = "---\nkernelspec:\n  name: python3\n---\nSee {cite}`smith2020`.\n"
+        content = convert_text(text, Direction.MYST_TO_QUARTO)
+        assert content.startswith("---\njupyter: python3\n---\n")
+        assert content.endswith("See [@smith2020].\n")
+
+    def test_quarto_to_myst(self):
+        """Documents without frontmatter convert to just the body."""
+        content = convert_text("See [@smith2020].\n", Direction.QUARTO_TO_MYST)
+        assert content == "See {cite}`smith2020`.\n"
+
+
 # ============================================================================
 # Convert directory tests
 # ============================================================================
@@ -308,6 +431,103 @@ class TestConvertDirectory:
         output_paths = [r.output_path for r in results if r.output_path]
         assert not any("helper.py" in p for p in output_paths)
 
+    def test_nested_markdown_output_dirs_created(self, myst_project, tmp_path):
+        """Output subdirectories are created for nested markdown files."""
+        output_dir = tmp_path / "output"
+
+        convert_directory(
+            str(myst_project),
+            str(output_dir),
+            Direction.MYST_TO_QUARTO,
+        )
+
+        assert (output_dir / "chapters" / "chapter1.qmd").read_text() == (
+            "# Chapter 1\n\nContent of chapter 1.\n"
+        )
+
+    def test_relative_input_dir(self, myst_project, monkeypatch):
+        """Relative input paths map to the same relative output layout."""
+        monkeypatch.chdir(myst_project.parent)
+        input_dir = os.path.join(".", myst_project.name, "")
+
+        convert_directory(input_dir, "out", Direction.MYST_TO_QUARTO)
+
+        output_dir = myst_project.parent / "out"
+        assert (output_dir / "chapters" / "chapter1.qmd").exists()
+        assert (output_dir / "helper.py").exists()
+
+    def test_nested_assets_copied(self, myst_project, tmp_path):
+        """Assets in subdirectories are copied with their relative paths."""
+        (myst_project / "figures").mkdir()
+        (myst_project / "figures" / "plot.png").write_bytes(b"\x89PNG data")
+        output_dir = tmp_path / "output"
+
+        convert_directory(
+            str(myst_project),
+            str(output_dir),
+            Direction.MYST_TO_QUARTO,
+        )
+
+        assert (output_dir / "figures" / "plot.png").read_bytes() == b"\x89PNG data"
+
+    def test_cache_json_asset_copied(self, myst_project, tmp_path):
+        """User files named *.cache.json are copied like any other asset."""
+        (myst_project / "data").mkdir()
+        (myst_project / "data" / "results.cache.json").write_text('{"a": 1}')
+        output_dir = tmp_path / "output"
+
+        convert_directory(
+            str(myst_project),
+            str(output_dir),
+            Direction.MYST_TO_QUARTO,
+        )
+
+        assert (output_dir / "data" / "results.cache.json").read_text() == '{"a": 1}'
+
+    def test_large_asset_copied(self, myst_project, tmp_path):
+        """Assets above the copy_file_range threshold are copied intact."""
+        data = os.urandom(3 << 20)
+        (myst_project / "data.bin").write_bytes(data)
+        output_dir = tmp_path / "output"
+
+        convert_directory(
+            str(myst_project),
+            str(output_dir),
+            Direction.MYST_TO_QUARTO,
+        )
+
+        assert (output_dir / "data.bin").read_bytes() == data
+
+    def test_large_asset_copy_falls_back(self, myst_project, tmp_path, monkeypatch):
+        """An asset is rewritten in full if copy_file_range stops early."""
+        monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+        data = os.urandom(3 << 20)
+        (myst_project / "data.bin").write_bytes(data)
+        output_dir = tmp_path / "output"
+
+        convert_directory(
+            str(myst_project),
+            str(output_dir),
+            Direction.MYST_TO_QUARTO,
+        )
+
+        assert (output_dir / "data.bin").read_bytes() == data
+
+    def test_executable_asset_keeps_mode(self, myst_project, tmp_path):
+        """Executable assets stay executable in the output."""
+        script = myst_project / "build.sh"
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o755)
+        output_dir = tmp_path / "output"
+
+        convert_directory(
+            str(myst_project),
+            str(output_dir),
+            Direction.MYST_TO_QUARTO,
+        )
+
+        assert (output_dir / "build.sh").stat().st_mode & 0o777 == 0o755
+
     def test_file_extension_renaming_myst_to_quarto(self, myst_project, tmp_path):
         """MyST .md files become .qmd in output."""
         output_dir = tmp_path / "output"
@@ -426,6 +646,94 @@ class TestConvertDirectory:
         expected_dir = str(myst_project) + "-quarto"
         assert os.path.isdir(expected_dir)
 
+    def test_many_files_converted_in_parallel(self, tmp_path, monkeypatch):
+        """Large directories go through the process pool with ordered results."""
+        import concurrent.futures
+
+        pools = []
+
+        class SpyPool(concurrent.futures.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", SpyPool)
+        src = tmp_path / "src"
+        src.mkdir()
+        for n in range(12):
+            (src / f"ch{n:02d}.md").write_text(f"# Chapter {n}\n\n{{cite}}`ref{n}`\n")
+        output_dir = tmp_path / "output"
+
+        results = convert_directory(
+            str(src),
+            str(output_dir),
+            Direction.MYST_TO_QUARTO,
+            num_workers=2,
+        )
+
+        assert len(pools) == 1
+        assert [os.path.basename(r.input_path) for r in results] == [
+            f"ch{n:02d}.md" for n in range(12)
+        ]
+        for n in range(12):
+            content = (output_dir / f"ch{n:02d}.qmd").read_text()
+            assert f"[@ref{n}]" in content
+
+    def test_no_scan_threads_when_pool_starts(self, tmp_path, monkeypatch):
+        """The process pool is never forked while directory scan threads run."""
+        import concurrent.futures
+        import threading
+
+        thread_counts = []
+
+        class SpyPool(concurrent.futures.ProcessPoolExecutor):
+            def submit(self, *args, **kwargs):
+                thread_counts.append(threading.active_count())
+                return super().submit(*args, **kwargs)
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", SpyPool)
+        src = tmp_path / "src"
+        for sub in ("a", "b", "c"):
+            (src / sub).mkdir(parents=True)
+            for n in range(4):
+                (src / sub / f"ch{n}.md").write_text(f"# Chapter {n}\n")
+
+        results = convert_directory(
+            str(src),
+            str(tmp_path / "output"),
+            Direction.MYST_TO_QUARTO,
+            num_workers=2,
+        )
+
+        assert len(results) == 12
+        assert thread_counts[0] == threading.active_count()
+
+    def test_single_worker_converts_serially(self, tmp_path, monkeypatch):
+        """num_workers=1 converts large directories without a process pool."""
+        import concurrent.futures
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        src = tmp_path / "src"
+        src.mkdir()
+        for n in range(12):
+            (src / f"ch{n:02d}.md").write_text(f"# Chapter {n}\n\n{{cite}}`ref{n}`\n")
+        output_dir = tmp_path / "output"
+
+        results = convert_directory(
+            str(src),
+            str(output_dir),
+            Direction.MYST_TO_QUARTO,
+            num_workers=1,
+        )
+
+        assert len(results) == 12
+        assert all(not r.errors for r in results)
+        assert "[@ref3]" in (output_dir / "ch03.qmd").read_text()
+
     def test_single_file_path(self, tmp_path):
         """When path is a single file, convert just that file."""
         input_file = tmp_path / "doc.md"
@@ -452,33 +760,32 @@ class TestConvertDirectory:
 class TestMyst2QuartoCLI:
     """Tests for the myst2quarto CLI command."""
 
-    def test_myst2quarto_single_file(self, tmp_path):
+    def test_myst2quarto_single_file(self, cli_runner, tmp_path):
         """myst2quarto converts a single .md file."""
         input_file = tmp_path / "doc.md"
         input_file.write_text("# Hello\n\nSee {cite}`ref1`.\n")
         output_dir = tmp_path / "output"
 
-        runner = CliRunner()
-        result = runner.invoke(myst2quarto, [str(input_file), "-o", str(output_dir)])
+        result = cli_runner.invoke(
+            myst2quarto, [str(input_file), "-o", str(output_dir)]
+        )
 
         assert result.exit_code == 0, f"CLI failed: {result.output}"
         assert (output_dir / "doc.qmd").exists()
 
-    def test_myst2quarto_directory(self, myst_project):
+    def test_myst2quarto_directory(self, cli_runner, myst_project):
         """myst2quarto converts a directory of .md files."""
         output_dir = str(myst_project) + "-out"
 
-        runner = CliRunner()
-        result = runner.invoke(myst2quarto, [str(myst_project), "-o", output_dir])
+        result = cli_runner.invoke(myst2quarto, [str(myst_project), "-o", output_dir])
 
         assert result.exit_code == 0, f"CLI failed: {result.output}"
         assert os.path.isdir(output_dir)
         assert os.path.exists(os.path.join(output_dir, "intro.qmd"))
 
-    def test_nonexistent_path(self, tmp_path):
+    def test_nonexistent_path(self, cli_runner, tmp_path):
         """Error for nonexistent input path."""
-        runner = CliRunner()
-        result = runner.invoke(myst2quarto, [str(tmp_path / "nope")])
+        result = cli_runner.invoke(myst2quarto, [str(tmp_path / "nope")])
 
         assert result.exit_code != 0
 
@@ -486,24 +793,24 @@ class TestMyst2QuartoCLI:
 class TestQuarto2MystCLI:
     """Tests for the quarto2myst CLI command."""
 
-    def test_quarto2myst_single_file(self, tmp_path):
+    def test_quarto2myst_single_file(self, cli_runner, tmp_path):
         """quarto2myst converts a single .qmd file."""
         input_file = tmp_path / "doc.qmd"
         input_file.write_text("# Hello\n\nSee [@ref1].\n")
         output_dir = tmp_path / "output"
 
-        runner = CliRunner()
-        result = runner.invoke(quarto2myst, [str(input_file), "-o", str(output_dir)])
+        result = cli_runner.invoke(
+            quarto2myst, [str(input_file), "-o", str(output_dir)]
+        )
 
         assert result.exit_code == 0, f"CLI failed: {result.output}"
         assert (output_dir / "doc.md").exists()
 
-    def test_quarto2myst_directory(self, quarto_project):
+    def test_quarto2myst_directory(self, cli_runner, quarto_project):
         """quarto2myst converts a directory of .qmd files."""
         output_dir = str(quarto_project) + "-out"
 
-        runner = CliRunner()
-        result = runner.invoke(quarto2myst, [str(quarto_project), "-o", output_dir])
+        result = cli_runner.invoke(quarto2myst, [str(quarto_project), "-o", output_dir])
 
         assert result.exit_code == 0, f"CLI failed: {result.output}"
         assert os.path.isdir(output_dir)
@@ -513,31 +820,55 @@ class TestQuarto2MystCLI:
 class TestCLIOptions:
     """Tests for CLI option flags."""
 
-    def test_output_option(self, myst_project, tmp_path):
+    def test_output_option(self, cli_runner, myst_project, tmp_path):
         """--output writes to specified directory."""
         output_dir = tmp_path / "custom_output"
 
-        runner = CliRunner()
-        result = runner.invoke(myst2quarto, [str(myst_project), "-o", str(output_dir)])
+        result = cli_runner.invoke(
+            myst2quarto, [str(myst_project), "-o", str(output_dir)]
+        )
 
         assert result.exit_code == 0, f"CLI failed: {result.output}"
         assert output_dir.exists()
         assert (output_dir / "intro.qmd").exists()
 
-    def test_in_place_option(self, myst_project):
+    def test_rerun_reports_up_to_date_files(self, cli_runner, myst_project, tmp_path):
+        """A second run counts the unchanged config as skipped, not converted."""
+        args = [str(myst_project), "-o", str(tmp_path / "output")]
+        cli_runner.invoke(myst2quarto, args)
+
+        result = cli_runner.invoke(myst2quarto, args)
+
+        assert result.exit_code == 0, f"CLI failed: {result.output}"
+        assert "Converted 0 file(s)." in result.output
+        assert "Skipped 4 up-to-date file(s)." in result.output
+
+    def test_force_regenerates_config(self, cli_runner, myst_project, tmp_path):
+        """--force rewrites a config even when its sidecar says it is current."""
+        output_dir = tmp_path / "output"
+        args = [str(myst_project), "-o", str(output_dir)]
+        cli_runner.invoke(myst2quarto, args)
+        (output_dir / "_quarto.yml").write_text("title: Hand edited\n")
+
+        result = cli_runner.invoke(myst2quarto, [*args, "--force"])
+
+        assert result.exit_code == 0, f"CLI failed: {result.output}"
+        quarto_config = yaml.safe_load((output_dir / "_quarto.yml").read_text())
+        assert quarto_config["book"]["title"] == "Test Project"
+        assert "Skipped" not in result.output
+
+    def test_in_place_option(self, cli_runner, myst_project):
         """--in-place modifies source files."""
-        runner = CliRunner()
-        result = runner.invoke(myst2quarto, [str(myst_project), "--in-place"])
+        result = cli_runner.invoke(myst2quarto, [str(myst_project), "--in-place"])
 
         assert result.exit_code == 0, f"CLI failed: {result.output}"
         assert (myst_project / "intro.qmd").exists()
 
-    def test_dry_run(self, myst_project, tmp_path):
+    def test_dry_run(self, cli_runner, myst_project, tmp_path):
         """--dry-run shows changes without writing."""
         output_dir = tmp_path / "output"
 
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             myst2quarto, [str(myst_project), "-o", str(output_dir), "--dry-run"]
         )
 
@@ -546,12 +877,11 @@ class TestCLIOptions:
         if output_dir.exists():
             assert not (output_dir / "intro.qmd").exists()
 
-    def test_config_only(self, myst_project, tmp_path):
+    def test_config_only(self, cli_runner, myst_project, tmp_path):
         """--config-only only converts config files."""
         output_dir = tmp_path / "output"
 
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             myst2quarto, [str(myst_project), "-o", str(output_dir), "--config-only"]
         )
 
@@ -559,12 +889,11 @@ class TestCLIOptions:
         assert (output_dir / "_quarto.yml").exists()
         assert not (output_dir / "intro.qmd").exists()
 
-    def test_no_config(self, myst_project, tmp_path):
+    def test_no_config(self, cli_runner, myst_project, tmp_path):
         """--no-config skips config conversion."""
         output_dir = tmp_path / "output"
 
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             myst2quarto, [str(myst_project), "-o", str(output_dir), "--no-config"]
         )
 
@@ -572,57 +901,100 @@ class TestCLIOptions:
         assert not (output_dir / "_quarto.yml").exists()
         assert (output_dir / "intro.qmd").exists()
 
-    def test_strict_mode(self, tmp_path):
+    def test_strict_mode(self, cli_runner, tmp_path):
         """--strict treats warnings as errors and exits nonzero."""
         # Create a file with content that might generate warnings
         input_file = tmp_path / "doc.md"
         input_file.write_text("# Hello\n")
         output_dir = tmp_path / "output"
 
-        runner = CliRunner()
         # With strict mode, the command should still succeed if no warnings
-        result = runner.invoke(
+        result = cli_runner.invoke(
             myst2quarto, [str(input_file), "-o", str(output_dir), "--strict"]
         )
         # Should succeed if there are no warnings
         assert result.exit_code == 0, f"CLI failed: {result.output}"
 
+    def test_jobs_option(self, cli_runner, myst_project, tmp_path):
+        """-j/--jobs sets the worker count without changing the output."""
+        outputs = []
+        for jobs in ("1", "4"):
+            output_dir = tmp_path / f"output-{jobs}"
+            result = cli_runner.invoke(
+                myst2quarto, [str(myst_project), "-o", str(output_dir), "-j", jobs]
+            )
+            assert result.exit_code == 0, f"CLI failed: {result.output}"
+            outputs.append((output_dir / "intro.qmd").read_text())
+
+        assert outputs[0] == outputs[1]
+
+    def test_jobs_must_be_positive(self, cli_runner, myst_project):
+        """--jobs 0 is rejected."""
+        result = cli_runner.invoke(myst2quarto, [str(myst_project), "--jobs", "0"])
+        assert result.exit_code != 0
+
 
 class TestMainSubcommands:
     """Tests for the main mystquarto group command."""
 
-    def test_main_to_quarto_subcommand(self, tmp_path):
+    def test_main_to_quarto_subcommand(self, cli_runner, tmp_path):
         """mystquarto to-quarto works."""
         input_file = tmp_path / "doc.md"
         input_file.write_text("# Hello\n\nSee {cite}`ref1`.\n")
         output_dir = tmp_path / "output"
 
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             main, ["to-quarto", str(input_file), "-o", str(output_dir)]
         )
 
         assert result.exit_code == 0, f"CLI failed: {result.output}"
         assert (output_dir / "doc.qmd").exists()
 
-    def test_main_to_myst_subcommand(self, tmp_path):
+    def test_main_to_myst_subcommand(self, cli_runner, tmp_path):
         """mystquarto to-myst works."""
         input_file = tmp_path / "doc.qmd"
         input_file.write_text("# Hello\n\nSee [@ref1].\n")
         output_dir = tmp_path / "output"
 
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             main, ["to-myst", str(input_file), "-o", str(output_dir)]
         )
 
         assert result.exit_code == 0, f"CLI failed: {result.output}"
         assert (output_dir / "doc.md").exists()
 
-    def test_main_no_subcommand(self):
+    def test_main_no_cache_flag(self, cli_runner, myst_project, tmp_path):
+        """mystquarto --no-cache regenerates configs that are up to date."""
+        output_dir = tmp_path / "output"
+        cli_runner.invoke(main, ["to-quarto", str(myst_project), "-o", str(output_dir)])
+        (output_dir / "_quarto.yml").write_text("title: Stale\n")
+
+        result = cli_runner.invoke(
+            main, ["--no-cache", "to-quarto", str(myst_project), "-o", str(output_dir)]
+        )
+
+        assert result.exit_code == 0, f"CLI failed: {result.output}"
+        config = yaml.safe_load((output_dir / "_quarto.yml").read_text())
+        assert "book" in config
+        assert "MYSTQUARTO_NO_CACHE" not in os.environ
+
+    def test_command_no_cache_flag(self, cli_runner, myst_project, tmp_path):
+        """--no-cache is also accepted by each conversion command."""
+        output_dir = tmp_path / "output"
+        args = [str(myst_project), "-o", str(output_dir)]
+        cli_runner.invoke(myst2quarto, args)
+        (output_dir / "_quarto.yml").write_text("title: Stale\n")
+
+        result = cli_runner.invoke(myst2quarto, [*args, "--no-cache"])
+
+        assert result.exit_code == 0, f"CLI failed: {result.output}"
+        config = yaml.safe_load((output_dir / "_quarto.yml").read_text())
+        assert "book" in config
+        assert "MYSTQUARTO_NO_CACHE" not in os.environ
+
+    def test_main_no_subcommand(self, cli_runner):
         """Running mystquarto without subcommand shows help."""
-        runner = CliRunner()
-        result = runner.invoke(main, [])
+        result = cli_runner.invoke(main, [])
 
         # Should show help, not error
         assert result.exit_code == 0
@@ -12,6 +12,7 @@ from mystquarto.config import (
     convert_quarto_config,
     myst_to_quarto_config,
     quarto_to_myst_config,
+    write_converted_config,
 )
 from mystquarto.frontmatter import (
     extract_frontmatter,
@@ -19,6 +20,7 @@ from mystquarto.frontmatter import (
     quarto_to_myst_frontmatter,
     replace_frontmatter,
 )
+from mystquarto.yamlio import _DUMP_OPTIONS, SafeDumper, dump_yaml
 
 
 # =========================================================================
@@ -177,6 +179,36 @@ class TestAuthorsWithAffiliations:
             {"name": "Bob Jones", "affiliations": ["Stanford"]},
         ]
 
+    def test_string_authors(self):
+        myst = {"project": {"title": "Paper", "authors": ["Alice Smith"]}}
+        result = myst_to_quarto_config(myst)
+        assert result["author"] == ["Alice Smith"]
+
+    def test_result_does_not_alias_input(self):
+        myst = {
+            "project": {
+                "authors": [{"name": "Alice Smith", "affiliations": ["MIT"]}],
+                "keywords": ["economics"],
+                "exports": [{"format": "pdf", "geometry": ["margin=1in"]}],
+            }
+        }
+        result = myst_to_quarto_config(myst)
+        result["author"][0]["affiliations"].append("Harvard")
+        result["keywords"].append("policy")
+        result["format"]["pdf"]["geometry"].append("a4paper")
+
+        assert myst["project"]["authors"][0]["affiliations"] == ["MIT"]
+        assert myst["project"]["keywords"] == ["economics"]
+        assert myst["project"]["exports"][0]["geometry"] == ["margin=1in"]
+
+        quarto = {"author": [{"name": "Bob Jones"}], "format": {"pdf": {"toc": True}}}
+        result = quarto_to_myst_config(quarto)
+        result["project"]["authors"][0]["name"] = "Changed"
+        result["project"]["exports"][0]["toc"] = False
+
+        assert quarto["author"][0]["name"] == "Bob Jones"
+        assert quarto["format"]["pdf"]["toc"] is True
+
 
 class TestConfigRoundtrip:
     """myst -> quarto -> myst preserves data."""
@@ -282,6 +314,85 @@ class TestConfigFileIO:
             myst_data = yaml.safe_load(f)
         assert myst_data["project"]["title"] == "Quarto to MyST"
 
+    def test_edited_config_is_reparsed(self, tmp_path):
+        myst_path = tmp_path / "myst.yml"
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        myst_path.write_text("project:\n  title: First\n")
+        convert_myst_config(str(myst_path), str(output_dir))
+        myst_path.write_text("project:\n  title: Second edition\n")
+        result_path = convert_myst_config(str(myst_path), str(output_dir))
+
+        with open(result_path) as f:
+            quarto_data = yaml.safe_load(f)
+        assert quarto_data["title"] == "Second edition"
+
+    def test_unchanged_config_is_not_regenerated(self, tmp_path):
+        myst_path = tmp_path / "myst.yml"
+        myst_path.write_text("project:\n  title: Cached\n")
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        result_path = convert_myst_config(str(myst_path), str(output_dir))
+        assert os.path.exists(result_path + ".cache.json")
+        with open(result_path, "w") as f:
+            f.write("title: Hand edited\n")
+
+        convert_myst_config(str(myst_path), str(output_dir))
+        with open(result_path) as f:
+            assert yaml.safe_load(f)["title"] == "Hand edited"
+
+    def test_write_converted_config_reports_skip(self, tmp_path):
+        myst_path = tmp_path / "myst.yml"
+        myst_path.write_text("project:\n  title: Cached\n")
+        output_path = str(tmp_path / "_quarto.yml")
+
+        assert not write_converted_config(
+            str(myst_path), output_path, myst_to_quarto_config
+        )
+        assert write_converted_config(
+            str(myst_path), output_path, myst_to_quarto_config
+        )
+
+    def test_touched_config_is_not_regenerated(self, tmp_path):
+        myst_path = tmp_path / "myst.yml"
+        myst_path.write_text("project:\n  title: Cached\n")
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        result_path = convert_myst_config(str(myst_path), str(output_dir))
+        with open(result_path, "w") as f:
+            f.write("title: Hand edited\n")
+
+        # Same bytes, new mtime: still up to date
+        st = os.stat(myst_path)
+        os.utime(myst_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        convert_myst_config(str(myst_path), str(output_dir))
+        with open(result_path) as f:
+            assert yaml.safe_load(f)["title"] == "Hand edited"
+
+        # Same size, different bytes: regenerated
+        myst_path.write_text("project:\n  title: Dached\n")
+        convert_myst_config(str(myst_path), str(output_dir))
+        with open(result_path) as f:
+            assert yaml.safe_load(f)["title"] == "Dached"
+
+    def test_no_cache_env_forces_regeneration(self, tmp_path, monkeypatch):
+        quarto_path = tmp_path / "_quarto.yml"
+        quarto_path.write_text("title: Fresh\n")
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        result_path = convert_quarto_config(str(quarto_path), str(output_dir))
+        with open(result_path, "w") as f:
+            f.write("project:\n  title: Stale\n")
+
+        monkeypatch.setenv("MYSTQUARTO_NO_CACHE", "1")
+        convert_quarto_config(str(quarto_path), str(output_dir))
+        with open(result_path) as f:
+            assert yaml.safe_load(f)["project"]["title"] == "Fresh"
+
 
 class TestAdditionalConfigFields:
     """Test github, license, keywords, date, subject mappings."""
@@ -637,6 +748,25 @@ class TestExtractFrontmatter:
         assert fm["tags"] == ["python", "data"]
         assert "Body text." in body
 
+    def test_dashes_inside_value_do_not_close(self):
+        text = "---\ntitle: a---b\n---\nBody\n---\nMore\n"
+        fm, body = extract_frontmatter(text)
+        assert fm == {"title": "a---b"}
+        assert body == "Body\n---\nMore\n"
+
+    def test_unclosed_frontmatter(self):
+        text = "---\ntitle: Draft\n\nBody\n"
+        fm, body = extract_frontmatter(text)
+        assert fm is None
+        assert body == text
+
+    def test_repeated_frontmatter_is_independent(self):
+        text = "---\nkernelspec:\n  name: python3\n---\nBody\n"
+        first, _ = extract_frontmatter(text)
+        first["kernelspec"]["name"] = "ir"
+        second, _ = extract_frontmatter(text)
+        assert second == {"kernelspec": {"name": "python3"}}
+
 
 class TestNoFrontmatter:
     """Text without frontmatter."""
@@ -680,6 +810,81 @@ class TestReplaceFrontmatter:
         assert "# Heading" in body
         assert "Body content." in body
 
+    def test_unchanged_frontmatter_keeps_text(self):
+        text = "---\ntitle:   'Same'  # comment\n---\nBody.\n"
+        assert replace_frontmatter(text, {"title": "Same"}) is text
+
+    def test_empty_frontmatter_is_removed(self):
+        text = "---\ntitle: Old\n---\nBody.\n"
+        assert replace_frontmatter(text, {}) == "Body.\n"
+
+
+class TestDumpYaml:
+    """Frontmatter YAML output matches PyYAML's dumper."""
+
+    def test_matches_yaml_dump(self):
+        samples = [
+            {"title": "Introduction", "draft": True, "order": 3},
+            {"title": "yes"},
+            {"title": "Note: colons need quoting"},
+            {"title": "Smith's chapter"},
+            {"title": "A very long title " * 6},
+            {"author": [{"name": "A"}], "date": "2024-01-01"},
+            {},
+        ]
+        for fm in samples:
+            expected = yaml.dump(fm, default_flow_style=False, sort_keys=False)
+            assert yaml.safe_load(dump_yaml(fm)) == yaml.safe_load(expected)
+        assert dump_yaml(samples[0]) == "title: Introduction\ndraft: true\norder: 3\n"
+        assert dump_yaml({"title": "yes"}) == "title: 'yes'\n"
+
+    def test_nested_structures_match_dumper(self):
+        shared = ["a"]
+        samples = [
+            {
+                "project": {"type": "book"},
+                "book": {
+                    "title": "Test Project",
+                    "author": [{"name": "A", "affiliations": ["Uni", "Lab"]}],
+                    "chapters": ["intro.qmd", "methods.qmd"],
+                },
+            },
+            {"format": {"pdf": {}}},
+            {"toc": [["nested"]]},
+            {"x": shared, "y": shared},
+        ]
+        for data in samples:
+            expected = yaml.dump(data, default_flow_style=False, sort_keys=False)
+            assert dump_yaml(data) == expected
+
+    def test_fast_path_matches_safe_dumper(self):
+        samples = [
+            {"title": "Introduction", "draft": True, "order": 3},
+            {"title": "no", "tags": ["on", "Off", "null"]},
+            {"title": "x" * 71, "subtitle": "y" * 72},
+            {"author": [{"name": "José Müller", "email": "a@b.org"}]},
+            {"book": {"chapters": ["intro.qmd"], "format": {"html": {"toc": 1}}}},
+        ]
+        # Keys around the emitters' simple-key limits (122 pure Python, 128 C)
+        for length in (122, 123, 127, 128, 129, 200):
+            key = "k" * length
+            samples += [
+                {key: "v"},
+                {key: {"nested": "v"}},
+                {key: ["item"]},
+                {"outer": {key: {"nested": "v"}}},
+                {"items": [{key: {"nested": "v"}}]},
+            ]
+        for data in samples:
+            expected = yaml.dump(data, Dumper=SafeDumper, **_DUMP_OPTIONS)
+            assert dump_yaml(data) == expected, data
+
+    def test_non_ascii_written_unescaped(self):
+        fm = {"author": "José Müller", "title": "Ünïcode: notes"}
+        text = dump_yaml(fm)
+        assert "José Müller" in text
+        assert yaml.safe_load(text) == fm
+
 
 class TestFileExtensionUpdate:
     """.md -> .qmd in references."""
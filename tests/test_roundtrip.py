@@ -238,6 +238,12 @@ class TestQuartoMathWithId:
         # Should either pass through or wrap in math directive
         assert "a + b = c" in result
 
+    def test_indented_math_without_id_normalized(self):
+        """Unlabeled math is normalized even with no other Quarto syntax."""
+        text = "Prose.\n  $$\na + b = c\n  $$\n"
+        result = convert_quarto_to_myst(text)
+        assert result == "Prose.\n$$\na + b = c\n$$\n"
+
 
 # ===========================================================================
 # Quarto -> MyST: Inline transforms
@@ -324,6 +330,11 @@ class TestQuartoInlineCode:
         result = transform_quarto_inline(line)
         assert result == "The value is {eval}`compute_value()`."
 
+    def test_citation_syntax_inside_inline_code_untouched(self):
+        line = "Key `{python} refs['@smith2020']` here."
+        result = transform_quarto_inline(line)
+        assert result == "Key {eval}`refs['@smith2020']` here."
+
 
 class TestQuartoDocLink:
     """Test [text](file.qmd) -> {doc}`path`."""
@@ -523,3 +534,11 @@ class TestQuartoTableWithLabel:
         assert "```{table} My Table Caption" in result
         assert ":name: tbl-data" in result
         assert "| A | B |" in result
+
+    def test_caption_after_blank_line(self):
+        text = "| A | B |\n|---|---|\n| 1 | 2 |\n\n: Caption {#tbl-data}\n"
+        result = convert_quarto_to_myst(text)
+        assert result == (
+            "```{table} Caption\n:name: tbl-data\n\n"
+            "| A | B |\n|---|---|\n| 1 | 2 |\n```\n"
+        )